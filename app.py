@@ -18,14 +18,23 @@ import sys
 import math
 import re
 import json
+import queue
+import signal
+from pathlib import Path
 from urllib.parse import urlsplit
 from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from datetime import datetime, timezone, timedelta
-from threading import Lock, Thread
+from threading import Lock, Thread, local
 from flask import Flask, jsonify, redirect, request, send_from_directory
 from geopy.geocoders import Nominatim
 from apscheduler.schedulers.background import BackgroundScheduler
 from zoneinfo import ZoneInfo
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json via jsonify still works
+    orjson = None
 from sources import caddo as caddo_source
 from sources import lafayette as lafayette_source
 from sources import batonrouge as batonrouge_source
@@ -34,6 +43,26 @@ from sources import neworleans_archive as neworleans_archive_source
 
 app = Flask(__name__, static_folder='public', static_url_path='')
 
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class _OrjsonJSONProvider(DefaultJSONProvider):
+        """jsonify() through orjson, keeping the default provider's sorted keys
+        and its handling of dates, Decimals and UUIDs."""
+
+        _options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+        def dumps(self, obj, **kwargs):
+            if kwargs.get('indent') is not None:
+                # Pretty-printed debug responses keep the stdlib encoder.
+                return super().dumps(obj, **kwargs)
+            return orjson.dumps(obj, default=self.default, option=self._options).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonJSONProvider(app)
+
 
 def _env_setting(name: str, legacy_name: str, default: str = '') -> str:
     """Read the Louisiana911 setting while preserving Caddo911 deployments."""
@@ -91,6 +120,10 @@ DB_PATH = _resolve_db_path()
 # Archive settings: incidents older than this many days get moved to monthly archive DBs
 ARCHIVE_AFTER_DAYS = int(_env_setting('LOUISIANA911_ARCHIVE_DAYS', 'CADDO911_ARCHIVE_DAYS', '30'))
 BACKUP_RETENTION_WEEKS = int(_env_setting('LOUISIANA911_BACKUP_RETENTION_WEEKS', 'CADDO911_BACKUP_RETENTION_WEEKS', '5'))
+# Rows buffered per archive month before they are flushed to its database.
+ARCHIVE_BATCH_SIZE = 5000
+# Free pages reclaimed per archive run; keeps the post-archive lock short.
+ARCHIVE_VACUUM_PAGES = int(_env_setting('LOUISIANA911_VACUUM_PAGES', 'CADDO911_VACUUM_PAGES', '1000'))
 REPORT_CACHE_VERSION = 4
 
 def _get_archive_dir() -> str:
@@ -102,16 +135,31 @@ def _get_archive_db_path(year: int, month: int) -> str:
     archive_dir = _get_archive_dir()
     return os.path.join(archive_dir, f"caddo911_archive_{year:04d}_{month:02d}.db")
 
+# Archive files only appear when the archive job runs, so report endpoints
+# reuse a recent directory listing instead of calling listdir per request.
+ARCHIVE_LIST_CACHE_TTL_SECONDS = 30.0
+_archive_list_cache: dict[str, tuple[float, list[str]]] = {}
+
+
+def _invalidate_archive_list_cache() -> None:
+    _archive_list_cache.clear()
+
+
 def _list_archive_dbs() -> list[str]:
     """List all archive database files."""
     archive_dir = _get_archive_dir()
+    cached = _archive_list_cache.get(archive_dir)
+    if cached and time.monotonic() - cached[0] < ARCHIVE_LIST_CACHE_TTL_SECONDS:
+        return list(cached[1])
     if not os.path.isdir(archive_dir):
         return []
-    return sorted([
+    paths = sorted([
         os.path.join(archive_dir, f) 
         for f in os.listdir(archive_dir) 
         if f.startswith('caddo911_archive_') and f.endswith('.db')
     ])
+    _archive_list_cache[archive_dir] = (time.monotonic(), paths)
+    return list(paths)
 
 
 def _get_neworleans_raw_db_path(year: int) -> str:
@@ -241,16 +289,77 @@ def create_backup_snapshot(*, include_archives: bool = True) -> dict:
         "backup_dir": backup_dir,
     }
 
+# Per-connection cache/mmap tuning. Set LOUISIANA911_SQLITE_PERF_PRAGMAS=0 to
+# run with SQLite defaults (e.g. on very small hosts or when profiling).
+SQLITE_PERF_PRAGMAS = _env_setting('LOUISIANA911_SQLITE_PERF_PRAGMAS', 'CADDO911_SQLITE_PERF_PRAGMAS', '1').strip().lower() not in ('0', 'false', 'no', 'off')
+# Pooled connections live for the whole process and see every handler's SQL
+# (well over a hundred distinct statements counting the source-filter and
+# f-string variants), which can churn sqlite3's default 128-entry cache.
+SQLITE_CACHED_STATEMENTS = 256
+
+
+def _apply_perf_pragmas(conn: sqlite3.Connection) -> None:
+    if not SQLITE_PERF_PRAGMAS:
+        return
+    conn.executescript(
+        """
+        PRAGMA cache_size = -64000;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA journal_size_limit = 6144000;
+        """
+    )
+
+
 def _archive_db_connect(path: str, *, row_factory: bool = False) -> sqlite3.Connection:
     """Connect to an archive database."""
-    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn = sqlite3.connect(
+        path,
+        timeout=30,
+        check_same_thread=False,
+        cached_statements=SQLITE_CACHED_STATEMENTS,
+    )
     if row_factory:
         conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA busy_timeout = 5000;")
+    _apply_perf_pragmas(conn)
     return conn
 
+def _analyze_if_unanalyzed(cursor: sqlite3.Cursor) -> None:
+    """
+    Give the planner row statistics the first time a database is opened, so it
+    can choose between the overlapping is_active/source/first_seen indexes.
+    analysis_limit keeps this a sampled pass even on a large file.
+    """
+    has_stats = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    ).fetchone()
+    if has_stats:
+        return
+    cursor.execute('PRAGMA analysis_limit = 1000')
+    cursor.execute('ANALYZE')
+
+
+def _drop_redundant_hash_index(cursor: sqlite3.Cursor) -> None:
+    """
+    `hash TEXT UNIQUE` already gives incidents a unique index on hash, so the
+    old explicit idx_hash only doubled index maintenance on every write. Drop
+    it, but only where that unique index really exists.
+    """
+    for index in cursor.execute('PRAGMA index_list(incidents)').fetchall():
+        index_name, is_unique = index[1], index[2]
+        if not is_unique:
+            continue
+        columns = [col[2] for col in cursor.execute(f'PRAGMA index_info("{index_name}")').fetchall()]
+        if columns == ['hash']:
+            cursor.execute('DROP INDEX IF EXISTS idx_hash')
+            return
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_hash ON incidents(hash)')
+
+
 def _init_archive_db(path: str) -> None:
     """Initialize an archive database with the same schema as main DB."""
+    _invalidate_archive_list_cache()
     conn = _archive_db_connect(path)
     cursor = conn.cursor()
     cursor.execute("PRAGMA journal_mode = WAL;")
@@ -287,10 +396,11 @@ def _init_archive_db(path: str) -> None:
     except sqlite3.OperationalError:
         pass
     cursor.execute("UPDATE incidents SET source = 'caddo' WHERE source IS NULL OR TRIM(source) = ''")
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_hash ON incidents(hash)')
+    _drop_redundant_hash_index(cursor)
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_first_seen ON incidents(first_seen)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_source ON incidents(source)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_source_first_seen ON incidents(source, first_seen DESC)')
+    _analyze_if_unanalyzed(cursor)
     conn.commit()
     conn.close()
 
@@ -326,21 +436,152 @@ def log(message: str) -> None:
     if not QUIET:
         print(message, flush=True)
 
+# SQLite only admits one writer at a time, so a single idle read/write
+# connection is kept for the collector, meta updates and maintenance jobs to
+# reuse. A caller that finds it already borrowed simply opens a fresh one;
+# SQLite's own locking still serializes the actual writes.
+_db_write_pools: dict[tuple[str, int], queue.Queue] = {}
+_db_write_pools_lock = Lock()
+
+
+class _PooledWriteConnection(sqlite3.Connection):
+    """Read/write connection whose close() hands it back to its pool."""
+
+    pool_key: tuple[str, int] | None = None
+    has_source_column = False
+
+    def close(self) -> None:
+        pool = _db_write_pools.get(self.pool_key) if self.pool_key else None
+        if pool is not None:
+            try:
+                if self.in_transaction:
+                    self.rollback()
+                self.row_factory = None
+                pool.put_nowait(self)
+                return
+            except (queue.Full, sqlite3.Error):
+                pass
+        super().close()
+
+
 def db_connect(*, row_factory: bool = False) -> sqlite3.Connection:
     """
-    Create a SQLite connection with sensible defaults for concurrent reader/writer usage
+    Borrow a SQLite connection with sensible defaults for concurrent reader/writer usage
     (collector + web UI in the same process).
     """
-    conn = sqlite3.connect(DB_PATH, timeout=30, check_same_thread=False)
+    pool_key = (DB_PATH, os.getpid())
+    pool = _db_write_pools.get(pool_key)
+    if pool is None:
+        with _db_write_pools_lock:
+            pool = _db_write_pools.setdefault(pool_key, queue.Queue(maxsize=1))
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = None
+    if conn is not None:
+        if row_factory:
+            conn.row_factory = sqlite3.Row
+        return conn
+
+    conn = sqlite3.connect(
+        DB_PATH,
+        timeout=30,
+        check_same_thread=False,
+        factory=_PooledWriteConnection,
+        cached_statements=SQLITE_CACHED_STATEMENTS,
+    )
+    conn.pool_key = pool_key
     if row_factory:
         conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA busy_timeout = 5000;")
+    # journal_mode=WAL is persistent and set once in init_db(). The rest are
+    # per-connection, so every request connection needs them re-applied.
+    conn.executescript(
+        """
+        PRAGMA busy_timeout = 5000;
+        PRAGMA synchronous = NORMAL;
+        """
+    )
+    _apply_perf_pragmas(conn)
+    return conn
+
+
+# Web handlers borrow read-only connections from a small pool (one per live or
+# archive database file) instead of connecting and re-running the pragma setup
+# on every API hit. WAL lets these readers run alongside the collector's writer
+# without blocking it.
+DB_READ_POOL_SIZE = max(1, int(_env_setting('LOUISIANA911_DB_READ_POOL_SIZE', 'CADDO911_DB_READ_POOL_SIZE', '8')))
+_db_read_pools: dict[tuple[str, int], queue.Queue] = {}
+_db_read_pools_lock = Lock()
+
+
+class _PooledReadConnection(sqlite3.Connection):
+    """Read-only connection whose close() hands it back to its pool."""
+
+    pool_key: tuple[str, int] | None = None
+    has_source_column = False
+
+    def close(self) -> None:
+        pool = _db_read_pools.get(self.pool_key) if self.pool_key else None
+        if pool is not None:
+            try:
+                if self.in_transaction:
+                    self.rollback()
+                pool.put_nowait(self)
+                return
+            except (queue.Full, sqlite3.Error):
+                pass
+        super().close()
+
+
+def db_read_connect(path: str | None = None) -> sqlite3.Connection:
+    """
+    Borrow a pooled read-only connection (Row factory) for the live DB, or for
+    the archive database at `path`.
+
+    Falls back to a regular read/write connection when the database cannot be
+    opened read-only yet (for example before init_db has created it).
+    """
+    db_path = path or DB_PATH
+    pool_key = (db_path, os.getpid())
+    pool = _db_read_pools.get(pool_key)
+    if pool is None:
+        with _db_read_pools_lock:
+            pool = _db_read_pools.setdefault(pool_key, queue.Queue(maxsize=DB_READ_POOL_SIZE))
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        pass
+
+    conn = None
+    try:
+        conn = sqlite3.connect(
+            Path(os.path.abspath(db_path)).as_uri() + '?mode=ro',
+            uri=True,
+            timeout=30,
+            check_same_thread=False,
+            factory=_PooledReadConnection,
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA busy_timeout = 5000;')
+        _apply_perf_pragmas(conn)
+        conn.execute('SELECT 1 FROM incidents LIMIT 0')
+    except sqlite3.Error:
+        if conn is not None:
+            sqlite3.Connection.close(conn)
+        if path is not None:
+            return _archive_db_connect(path, row_factory=True)
+        return db_connect(row_factory=True)
+    conn.pool_key = pool_key
     return conn
 
 def init_db():
     """Initialize SQLite database with incidents table"""
     conn = db_connect()
     cursor = conn.cursor()
+    # Only takes effect on a brand-new file; existing databases are converted
+    # by the first archive run (see _reclaim_free_pages).
+    cursor.execute("PRAGMA auto_vacuum = INCREMENTAL;")
     # Better concurrency for collector + UI
     cursor.execute("PRAGMA journal_mode = WAL;")
     cursor.execute("PRAGMA synchronous = NORMAL;")
@@ -364,9 +605,21 @@ def init_db():
             is_active INTEGER DEFAULT 1
         )
     ''')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_hash ON incidents(hash)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_active ON incidents(is_active)')
+    _drop_redundant_hash_index(cursor)
+    # (is_active, ...) composites below cover every is_active lookup, including
+    # the archive scan, so the single-column index only cost write overhead.
+    cursor.execute('DROP INDEX IF EXISTS idx_active')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_first_seen ON incidents(first_seen)')
+    # Let the active list and the day history walk rows already in order
+    # instead of sorting the filtered set in a temp b-tree.
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_active_time ON incidents(is_active, time DESC)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_active_first_seen ON incidents(is_active, first_seen DESC)')
+    # /api/stats groups the active rows by agency and description; a partial
+    # index covers both breakdowns and holds only the few hundred active rows.
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_active_agency_description '
+        'ON incidents(agency, description) WHERE is_active = 1'
+    )
 
     # Add geocoding metadata columns (safe to run on an existing DB; does NOT delete data)
     # Note: SQLite doesn't support ADD COLUMN IF NOT EXISTS in older versions, so we try/except.
@@ -395,29 +648,99 @@ def init_db():
             value TEXT
         )
     ''')
+    # Resolved geocoder answers survive restarts so known intersections do not
+    # go back out to ArcGIS/OSM after every deploy.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS geocode_cache (
+            key TEXT PRIMARY KEY,
+            result TEXT NOT NULL,
+            geocode_version INTEGER,
+            cached_at DATETIME
+        )
+    ''')
+    _analyze_if_unanalyzed(cursor)
     conn.commit()
     conn.close()
 
+# The meta table is a handful of scrape timestamps read by every /api/status
+# poll. Keep a per-database copy for a second: meta_set() updates it in place,
+# and the short TTL picks up writes from a collector in another process.
+META_CACHE_TTL_SECONDS = 1.0
+_meta_cache: dict[str, tuple[float, dict[str, str]]] = {}
+_meta_cache_lock = Lock()
+
+
 def meta_set(key: str, value: str | None) -> None:
-    if value is None:
+    meta_set_many({key: value})
+
+def meta_set_many(values: dict[str, str | None]) -> None:
+    """Write several meta keys in one transaction (None values are skipped)."""
+    items = [(key, value) for key, value in values.items() if value is not None]
+    if not items:
         return
     conn = db_connect()
-    conn.execute(
+    conn.executemany(
         "INSERT INTO meta(key, value) VALUES (?, ?) "
         "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        (key, value),
+        items,
     )
     conn.commit()
     conn.close()
+    with _meta_cache_lock:
+        cached = _meta_cache.get(DB_PATH)
+        if cached:
+            cached[1].update(items)
 
 def meta_get_many(keys: list[str]) -> dict[str, str]:
-    conn = db_connect(row_factory=True)
-    cursor = conn.cursor()
-    placeholders = ",".join(["?"] * len(keys))
-    cursor.execute(f"SELECT key, value FROM meta WHERE key IN ({placeholders})", keys)
-    rows = cursor.fetchall()
-    conn.close()
-    return {row["key"]: row["value"] for row in rows} if rows else {}
+    now = time.monotonic()
+    with _meta_cache_lock:
+        cached = _meta_cache.get(DB_PATH)
+        if cached and now - cached[0] < META_CACHE_TTL_SECONDS:
+            return {key: cached[1][key] for key in keys if key in cached[1]}
+    conn = db_read_connect()
+    try:
+        values = {row["key"]: row["value"] for row in conn.execute("SELECT key, value FROM meta")}
+    finally:
+        conn.close()
+    with _meta_cache_lock:
+        _meta_cache[DB_PATH] = (now, values)
+    return {key: values[key] for key in keys if key in values}
+
+def _reclaim_free_pages(conn: sqlite3.Connection) -> None:
+    """Return pages freed by archiving to the filesystem without a full rewrite."""
+    auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    if auto_vacuum != 2:
+        # Databases created before incremental mode need one full VACUUM to
+        # switch over; every later archive run only trims the freelist.
+        log("[ARCHIVE] Converting database to incremental auto-vacuum (one-time VACUUM)...")
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        return
+    log(f"[ARCHIVE] Reclaiming up to {ARCHIVE_VACUUM_PAGES} free pages...")
+    _incremental_vacuum(conn, ARCHIVE_VACUUM_PAGES)
+
+
+def _incremental_vacuum(conn: sqlite3.Connection, pages: int) -> None:
+    # The pragma frees one page per step and Connection.execute() only steps
+    # once, so run it through executescript(), which steps to completion.
+    conn.executescript(f"PRAGMA incremental_vacuum({max(0, int(pages))});")
+
+
+def run_db_maintenance() -> None:
+    """Refresh planner statistics, trim the WAL, and return free pages to the OS."""
+    conn = db_connect()
+    try:
+        conn.execute("PRAGMA optimize")
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            _incremental_vacuum(conn, ARCHIVE_VACUUM_PAGES)
+        busy, wal_pages, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    finally:
+        conn.close()
+    if busy:
+        log(f"[DB] Maintenance done; WAL checkpoint was blocked by readers ({wal_pages} pages)")
+    else:
+        log("[DB] Maintenance done; WAL truncated")
+
 
 def archive_old_incidents(*, dry_run: bool = False) -> dict:
     """
@@ -429,108 +752,139 @@ def archive_old_incidents(*, dry_run: bool = False) -> dict:
     
     conn = db_connect(row_factory=True)
     cursor = conn.cursor()
+
+    if not dry_run:
+        _prune_persistent_geocode_cache(conn)
     
-    # Find inactive incidents older than cutoff
+    # Find inactive incidents older than cutoff. Rows are streamed from the
+    # cursor and flushed to their month's archive in ARCHIVE_BATCH_SIZE
+    # chunks, so memory stays bounded however large the backlog is.
     cursor.execute('''
         SELECT * FROM incidents 
         WHERE is_active = 0 AND first_seen < ?
         ORDER BY first_seen ASC
     ''', (cutoff_iso,))
-    rows = cursor.fetchall()
     
-    if not rows:
+    found_count = 0
+    archived_count = 0
+    month_counts: dict[tuple[int, int], int] = {}
+    pending_by_month: dict[tuple[int, int], list[tuple]] = {}
+    archive_conns: dict[tuple[int, int], sqlite3.Connection] = {}
+
+    def flush_month(month_key: tuple[int, int]) -> None:
+        nonlocal archived_count
+        archive_rows = pending_by_month.pop(month_key, None)
+        if not archive_rows:
+            return
+        if dry_run:
+            archived_count += len(archive_rows)
+            return
+        archive_conn = archive_conns.get(month_key)
+        if archive_conn is None:
+            archive_path = _get_archive_db_path(*month_key)
+            _init_archive_db(archive_path)
+            archive_conn = archive_conns[month_key] = _archive_db_connect(archive_path)
+        # Insert into archive (use INSERT OR IGNORE to handle duplicates).
+        # Only rows that made it into the archive are removed from the main DB.
+        try:
+            archive_conn.executemany('''
+                INSERT OR IGNORE INTO incidents 
+                (hash, agency, time, units, description, street, cross_streets, municipality, source,
+                 latitude, longitude, first_seen, last_seen, is_active,
+                 geocode_source, geocode_quality, geocode_query, geocoded_at, geocode_version)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', archive_rows)
+            archive_conn.commit()
+        except sqlite3.Error as e:
+            archive_conn.rollback()
+            log(f"[ARCHIVE] Error archiving {month_key[0]}-{month_key[1]:02d}: {e}")
+            return
+        # Remove this batch from the main DB right away so no list of hashes
+        # builds up across the run. The streaming SELECT has already passed
+        # these rows, which SQLite allows deleting mid-scan.
+        conn.executemany(
+            'DELETE FROM incidents WHERE hash = ?',
+            [(row[0],) for row in archive_rows],
+        )
+        conn.commit()
+        archived_count += len(archive_rows)
+
+    # Central's UTC offset only changes on whole hours, so one zoneinfo
+    # conversion per distinct UTC hour decides the local month for every row
+    # in that hour.
+    central_month_by_utc_hour: dict[tuple[int, int, int, int], tuple[int, int]] = {}
+    try:
+        for row in cursor:
+            found_count += 1
+            inc = dict(row)
+            first_seen = inc.get('first_seen')
+            if not first_seen:
+                continue
+            dt = _parse_iso_datetime(first_seen)
+            if not dt:
+                continue
+            if dt.tzinfo is not timezone.utc:
+                dt = dt.astimezone(timezone.utc)
+            hour_key = (dt.year, dt.month, dt.day, dt.hour)
+            key = central_month_by_utc_hour.get(hour_key)
+            if key is None:
+                # Convert to Central time for archiving by local month
+                central_dt = dt.astimezone(CENTRAL_TZ)
+                key = (central_dt.year, central_dt.month)
+                central_month_by_utc_hour[hour_key] = key
+            month_counts[key] = month_counts.get(key, 0) + 1
+            month_rows = pending_by_month.setdefault(key, [])
+            month_rows.append((
+                inc.get('hash'),
+                inc.get('agency'),
+                inc.get('time'),
+                inc.get('units'),
+                inc.get('description'),
+                inc.get('street'),
+                inc.get('cross_streets'),
+                inc.get('municipality'),
+                inc.get('source') or 'caddo',
+                inc.get('latitude'),
+                inc.get('longitude'),
+                inc.get('first_seen'),
+                inc.get('last_seen'),
+                inc.get('is_active', 0),
+                inc.get('geocode_source'),
+                inc.get('geocode_quality'),
+                inc.get('geocode_query'),
+                inc.get('geocoded_at'),
+                inc.get('geocode_version'),
+            ))
+            if len(month_rows) >= ARCHIVE_BATCH_SIZE:
+                flush_month(key)
+        for key in list(pending_by_month):
+            flush_month(key)
+    finally:
+        for archive_conn in archive_conns.values():
+            archive_conn.close()
+    
+    if not found_count:
         conn.close()
         log(f"[ARCHIVE] No incidents older than {ARCHIVE_AFTER_DAYS} days to archive")
         return {'archived': 0, 'files': []}
     
-    log(f"[ARCHIVE] Found {len(rows)} incidents to archive{' (dry run)' if dry_run else ''}")
-    
-    # Group by year-month based on first_seen (in Central time)
-    by_month: dict[tuple[int, int], list[dict]] = {}
-    for row in rows:
-        row_dict = dict(row)
-        first_seen = row_dict.get('first_seen')
-        if not first_seen:
-            continue
-        dt = _parse_iso_datetime(first_seen)
-        if not dt:
-            continue
-        # Convert to Central time for archiving by local month
-        central_dt = dt.astimezone(CENTRAL_TZ)
-        key = (central_dt.year, central_dt.month)
-        if key not in by_month:
-            by_month[key] = []
-        by_month[key].append(row_dict)
-    
-    archived_count = 0
+    log(f"[ARCHIVE] Found {found_count} incidents to archive{' (dry run)' if dry_run else ''}")
     archived_files = []
-    hashes_to_delete = []
-    
-    for (year, month), incidents in sorted(by_month.items()):
+    for (year, month), count in sorted(month_counts.items()):
         archive_path = _get_archive_db_path(year, month)
-        log(f"[ARCHIVE] {year}-{month:02d}: {len(incidents)} incidents -> {os.path.basename(archive_path)}")
-        
-        if not dry_run:
-            _init_archive_db(archive_path)
-            archive_conn = _archive_db_connect(archive_path)
-            archive_cursor = archive_conn.cursor()
-            
-            for inc in incidents:
-                # Insert into archive (use INSERT OR IGNORE to handle duplicates)
-                try:
-                    archive_cursor.execute('''
-                        INSERT OR IGNORE INTO incidents 
-                        (hash, agency, time, units, description, street, cross_streets, municipality, source,
-                         latitude, longitude, first_seen, last_seen, is_active,
-                         geocode_source, geocode_quality, geocode_query, geocoded_at, geocode_version)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        inc.get('hash'),
-                        inc.get('agency'),
-                        inc.get('time'),
-                        inc.get('units'),
-                        inc.get('description'),
-                        inc.get('street'),
-                        inc.get('cross_streets'),
-                        inc.get('municipality'),
-                        inc.get('source') or 'caddo',
-                        inc.get('latitude'),
-                        inc.get('longitude'),
-                        inc.get('first_seen'),
-                        inc.get('last_seen'),
-                        inc.get('is_active', 0),
-                        inc.get('geocode_source'),
-                        inc.get('geocode_quality'),
-                        inc.get('geocode_query'),
-                        inc.get('geocoded_at'),
-                        inc.get('geocode_version'),
-                    ))
-                    hashes_to_delete.append(inc.get('hash'))
-                    archived_count += 1
-                except Exception as e:
-                    log(f"[ARCHIVE] Error archiving incident {inc.get('hash')}: {e}")
-            
-            archive_conn.commit()
-            archive_conn.close()
-        else:
-            archived_count += len(incidents)
-        
-        if archive_path not in archived_files:
-            archived_files.append(archive_path)
+        log(f"[ARCHIVE] {year}-{month:02d}: {count} incidents -> {os.path.basename(archive_path)}")
+        archived_files.append(archive_path)
     
-    # Delete archived incidents from main DB
-    if not dry_run and hashes_to_delete:
-        log(f"[ARCHIVE] Removing {len(hashes_to_delete)} archived incidents from main DB...")
-        for h in hashes_to_delete:
-            cursor.execute('DELETE FROM incidents WHERE hash = ?', (h,))
-        conn.commit()
+    # Archived incidents were removed from the main DB batch by batch above.
+    if not dry_run and archived_count:
+        log(f"[ARCHIVE] Removed {archived_count} archived incidents from main DB")
+        _bump_live_data_generation()
         
-        # Vacuum to reclaim space
-        log("[ARCHIVE] Running VACUUM to reclaim space...")
-        conn.execute("VACUUM")
+        _reclaim_free_pages(conn)
     
     conn.close()
     
+    _invalidate_archive_list_cache()
     log(f"[ARCHIVE] Complete! Archived {archived_count} incidents to {len(archived_files)} file(s)")
     return {'archived': archived_count, 'files': archived_files}
 
@@ -556,11 +910,15 @@ def _get_archive_dbs_for_month(month_str: str) -> list[str]:
         pass
     return []
 
+def _utc_now_iso() -> str:
+    """Current time as the timezone-aware UTC ISO string stored throughout the DB."""
+    return datetime.now(timezone.utc).isoformat()
+
 def _parse_iso_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
     try:
-        # We store timezone-aware ISO timestamps (UTC) via datetime.now(timezone.utc).isoformat()
+        # We store timezone-aware ISO timestamps (UTC) via _utc_now_iso()
         dt = datetime.fromisoformat(value)
         if dt.tzinfo is None:
             # Treat naive timestamps as UTC for backwards compatibility.
@@ -604,6 +962,14 @@ def _central_date_key(value: str | None) -> str | None:
     return c.date().isoformat() if c else None
 
 
+@lru_cache(maxsize=4096)
+def _central_day_for_utc_hour(hour: str | None) -> str | None:
+    """Central date for a UTC 'YYYY-MM-DDTHH' bucket (offsets are whole hours)."""
+    if not hour:
+        return None
+    return _central_date_key(f"{hour}:00:00+00:00")
+
+
 def _central_month_key(value: str | None) -> str | None:
     dt = _parse_iso_datetime(value)
     c = _to_central(dt)
@@ -619,19 +985,52 @@ def _to_central(dt: datetime | None) -> datetime | None:
     except Exception:
         return None
 
+def _central_tz_abbr(c: datetime) -> str:
+    """Zone abbreviation for a Central datetime; the fixed-offset fallback zone has none."""
+    return "CST" if CENTRAL_TZ_IS_FALLBACK else c.strftime("%Z")
+
+def _central_strftime(c: datetime, fmt: str) -> str:
+    """strftime with a trailing zone abbreviation."""
+    return f"{c.strftime(fmt)} {_central_tz_abbr(c)}"
+
 def _format_central_hms(dt: datetime | None) -> str | None:
     c = _to_central(dt)
-    if not c:
-        return None
-    abbr = "CST" if CENTRAL_TZ_IS_FALLBACK else c.strftime("%Z")
-    return f"{c.strftime('%H:%M:%S')} {abbr}"
+    return _central_strftime(c, '%H:%M:%S') if c else None
 
 def _format_central_tooltip(dt: datetime | None) -> str | None:
     c = _to_central(dt)
-    if not c:
-        return None
-    abbr = "CST" if CENTRAL_TZ_IS_FALLBACK else c.strftime("%Z")
-    return f"{c.strftime('%Y-%m-%d %H:%M:%S')} {abbr}"
+    return _central_strftime(c, '%Y-%m-%d %H:%M:%S') if c else None
+
+@lru_cache(maxsize=8)
+def _last_update_labels(last_update_iso: str | None, last_scrape_finished_iso: str | None) -> tuple[str | None, str | None]:
+    """Central display/tooltip strings for /api/status; inputs only change once per scrape."""
+    # Prefer scrape-finished time for "last update" display; otherwise fall back to last_update.
+    display_base = _parse_iso_datetime(last_scrape_finished_iso) or _parse_iso_datetime(last_update_iso)
+    return _format_central_hms(display_base), _format_central_tooltip(display_base)
+
+
+# (epoch second, serverNow, centralTzAbbr, centralDate) for /api/status. Every
+# poll inside the same second gets the same strings, so format them once.
+_status_clock_cache: tuple[int, str, str, str] = (0, '', '', '')
+
+
+def _status_clock() -> tuple[str, str, str]:
+    global _status_clock_cache
+    cached = _status_clock_cache
+    second = int(time.time())
+    if cached[0] != second:
+        now_utc = datetime.fromtimestamp(second, timezone.utc)
+        now_central = now_utc.astimezone(CENTRAL_TZ)
+        cached = (
+            second,
+            now_utc.isoformat(),
+            _central_tz_abbr(now_central),
+            now_central.date().isoformat(),
+        )
+        # A racing request may recompute the same second; the swap is atomic.
+        _status_clock_cache = cached
+    return cached[1], cached[2], cached[3]
+
 
 # Ensure schema exists even when running under a WSGI server (e.g. gunicorn app:app)
 # Safe to call multiple times.
@@ -988,11 +1387,201 @@ def _security_headers(resp):
     return resp
 
 # Geocoder setup with caching - try ArcGIS first (better US coverage), fallback to Nominatim
+from geopy.adapters import RequestsAdapter
 from geopy.geocoders import ArcGIS
-geolocator_arcgis = ArcGIS(timeout=5)
-geolocator_osm = Nominatim(user_agent=SCRAPER_USER_AGENT, timeout=5)
-geocode_cache = {}
-geocode_intersection_cache = {}
+# Pin geopy to its keep-alive requests adapter (never the urllib one) and size
+# the pool for the prefetch workers plus the paired-lookup pool running at once.
+_geocoder_adapter_factory = partial(RequestsAdapter, pool_connections=2, pool_maxsize=8)
+geolocator_arcgis = ArcGIS(timeout=5, adapter_factory=_geocoder_adapter_factory)
+geolocator_osm = Nominatim(user_agent=SCRAPER_USER_AGENT, timeout=5, adapter_factory=_geocoder_adapter_factory)
+# Nominatim's usage policy allows at most one request per second. ArcGIS
+# lookups run in parallel, so OSM fallbacks are funneled through this gate.
+OSM_MIN_REQUEST_INTERVAL_SECONDS = 1.0
+_osm_request_lock = Lock()
+_osm_last_request_at = 0.0
+
+
+def _osm_geocode(query: str, **kwargs):
+    global _osm_last_request_at
+    with _osm_request_lock:
+        wait_seconds = _osm_last_request_at + OSM_MIN_REQUEST_INTERVAL_SECONDS - time.monotonic()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        try:
+            return geolocator_osm.geocode(query, **kwargs)
+        finally:
+            _osm_last_request_at = time.monotonic()
+
+
+# ArcGIS lookups stay concurrent, but their start times are spaced so a burst
+# of new incidents (or a --regeocode run) cannot flood the World Geocoder.
+ARCGIS_MIN_REQUEST_INTERVAL_SECONDS = float(_env_setting('LOUISIANA911_ARCGIS_MIN_INTERVAL_SECONDS', 'CADDO911_ARCGIS_MIN_INTERVAL_SECONDS', '0.1'))
+_arcgis_request_lock = Lock()
+_arcgis_next_request_at = 0.0
+
+
+def _arcgis_geocode(query: str, **kwargs):
+    global _arcgis_next_request_at
+    with _arcgis_request_lock:
+        now = time.monotonic()
+        start_at = max(now, _arcgis_next_request_at)
+        _arcgis_next_request_at = start_at + ARCGIS_MIN_REQUEST_INTERVAL_SECONDS
+    if start_at > now:
+        time.sleep(start_at - now)
+    return geolocator_arcgis.geocode(query, **kwargs)
+
+
+# New feed rows are geocoded by this many threads before the write lock is taken.
+GEOCODE_PREFETCH_WORKERS = 4
+
+# Both caches are bounded so weeks of collector uptime cannot grow them without
+# limit. Hits are moved to the end, so eviction drops the least recently used key.
+GEOCODE_CACHE_MAX_ENTRIES = max(1, int(_env_setting('LOUISIANA911_GEOCODE_CACHE_SIZE', 'CADDO911_GEOCODE_CACHE_SIZE', '4096')))
+geocode_cache: dict[str, dict] = {}
+# Same fields as functools.lru_cache's cache_info(), plus hits served from the
+# persisted table after the in-memory entry was evicted or the process restarted.
+geocode_cache_stats = {'hits': 0, 'persistent_hits': 0, 'misses': 0}
+geocode_intersection_cache: dict[tuple, dict] = {}
+# A provider-confirmed miss stays in memory for the life of the process, but its
+# persisted row only answers for an hour, so a restart gives it another chance.
+GEOCODE_NEGATIVE_CACHE_TTL_SECONDS = 3600
+_geocode_cache_lock = Lock()
+# Prefetch lookups run on worker threads before process_incidents() takes its
+# write lock, so each persists through its own short-lived connection. Only a
+# lookup made inside the transaction (a failed prefetch, or a row that changed
+# under the lock) sees the open connection published here, and writes through
+# it rather than blocking on the lock its own thread holds.
+_geocode_cache_txn = local()
+
+
+def _bounded_cache_get(cache: dict, key):
+    with _geocode_cache_lock:
+        value = cache.pop(key, None)
+        if value is not None:
+            cache[key] = value
+        return value
+
+
+def _bounded_cache_put(cache: dict, key, value) -> None:
+    with _geocode_cache_lock:
+        cache.pop(key, None)
+        cache[key] = value
+        while len(cache) > GEOCODE_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)), None)
+
+
+def _persistent_geocode_cache_get(cache_key: str) -> dict | None:
+    conn = getattr(_geocode_cache_txn, 'conn', None)
+    owns_conn = conn is None
+    try:
+        if owns_conn:
+            conn = db_read_connect()
+        row = conn.execute(
+            'SELECT result, cached_at FROM geocode_cache WHERE key = ? AND geocode_version = ?',
+            (cache_key, GEOCODER_VERSION),
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    finally:
+        if owns_conn and conn is not None:
+            conn.close()
+    if not row:
+        return None
+    try:
+        result = json.loads(row[0])
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(result, dict):
+        return None
+    if result.get('lat') is None:
+        cached_at = _parse_iso_datetime(row[1])
+        if cached_at is None:
+            return None
+        age = (datetime.now(timezone.utc) - cached_at).total_seconds()
+        if age >= GEOCODE_NEGATIVE_CACHE_TTL_SECONDS:
+            return None
+    return result
+
+
+def _persistent_geocode_cache_put(cache_key: str, result: dict) -> None:
+    conn = getattr(_geocode_cache_txn, 'conn', None)
+    owns_conn = conn is None
+    try:
+        if owns_conn:
+            conn = db_connect()
+        conn.execute(
+            '''INSERT OR REPLACE INTO geocode_cache (key, result, geocode_version, cached_at)
+               VALUES (?, ?, ?, ?)''',
+            (
+                cache_key,
+                json.dumps(result),
+                GEOCODER_VERSION,
+                _utc_now_iso(),
+            ),
+        )
+        if owns_conn:
+            conn.commit()
+    except sqlite3.Error as e:
+        log(f"[WARN] Could not persist geocode cache entry: {e}")
+    finally:
+        if owns_conn and conn is not None:
+            conn.close()
+
+
+def _prune_persistent_geocode_cache(conn: sqlite3.Connection) -> None:
+    """Drop persisted answers lookups would ignore: older geocoder versions and expired misses."""
+    negative_cutoff = (
+        datetime.now(timezone.utc) - timedelta(seconds=GEOCODE_NEGATIVE_CACHE_TTL_SECONDS)
+    ).isoformat()
+    try:
+        deleted = conn.execute(
+            '''DELETE FROM geocode_cache
+               WHERE geocode_version IS NOT ?
+                  OR (json_extract(result, '$.lat') IS NULL AND cached_at < ?)''',
+            (GEOCODER_VERSION, negative_cutoff),
+        ).rowcount
+        conn.commit()
+    except sqlite3.Error as e:
+        log(f"[WARN] Could not prune persisted geocode cache: {e}")
+        return
+    if deleted:
+        log(f"[ARCHIVE] Pruned {deleted} stale geocode cache entries")
+
+
+def _remember_geocode(cache_key: str, result: dict) -> None:
+    """Cache a resolved geocode (or a provider-confirmed miss) in memory and in the database."""
+    _bounded_cache_put(geocode_cache, cache_key, result)
+    _persistent_geocode_cache_put(cache_key, result)
+
+
+def _count_geocode_cache(outcome: str) -> None:
+    with _geocode_cache_lock:
+        geocode_cache_stats[outcome] += 1
+
+
+def geocode_cache_info() -> dict:
+    with _geocode_cache_lock:
+        return {
+            **geocode_cache_stats,
+            'maxsize': GEOCODE_CACHE_MAX_ENTRIES,
+            'currsize': len(geocode_cache),
+        }
+
+
+def clear_geocode_caches() -> None:
+    """Drop every cached geocoder answer, including the persisted ones."""
+    geocode_cache.clear()
+    geocode_intersection_cache.clear()
+    with _geocode_cache_lock:
+        for outcome in geocode_cache_stats:
+            geocode_cache_stats[outcome] = 0
+    try:
+        conn = db_connect()
+        conn.execute('DELETE FROM geocode_cache')
+        conn.commit()
+        conn.close()
+    except sqlite3.Error as e:
+        log(f"[WARN] Could not clear persisted geocode cache: {e}")
 
 # Increment whenever stored coordinates need to be reconsidered because the
 # validation/ranking algorithm changed. Version 4 removed CAD-only road
@@ -1189,19 +1778,19 @@ def _source_geo_profile(source: str | None) -> dict:
 
 def _point_in_ring(lon: float, lat: float, ring: list[tuple[float, float]]) -> bool:
     inside = False
-    count = len(ring)
-    if count < 3:
+    if len(ring) < 3:
         return False
 
-    for idx in range(count):
-        x1, y1 = ring[idx]
-        x2, y2 = ring[(idx + 1) % count]
-        crosses_lat = (y1 > lat) != (y2 > lat)
-        if not crosses_lat:
+    # Walk each edge once as (previous vertex, vertex), closing the ring.
+    x1, y1 = ring[-1]
+    for x2, y2 in ring:
+        if (y1 > lat) == (y2 > lat):
+            x1, y1 = x2, y2
             continue
         x_at_lat = (x2 - x1) * (lat - y1) / ((y2 - y1) or 1e-12) + x1
         if lon < x_at_lat:
             inside = not inside
+        x1, y1 = x2, y2
     return inside
 
 
@@ -1257,8 +1846,19 @@ def _dedupe_keep_order(items: list[str]) -> list[str]:
         out.append(it)
     return out
 
+# Compiled once: these run for every street/cross field on every scrape.
+WHITESPACE_RE = re.compile(r"\s+")
+NON_ALNUM_RUN_RE = re.compile(r"[^A-Z0-9]+")
+CROSS_AND_SEPARATOR_RE = re.compile(r"\s+\band\b\s+", re.IGNORECASE)
+# Used when comparing provider answers against the requested roads.
+ROAD_TOKEN_RE = re.compile(r"[A-Z0-9]+")
+ROAD_JOINER_RE = re.compile(r"\s+(?:&|AND|AT)\s+", re.IGNORECASE)
+# Padded with spaces so "A/AND B" still exposes " AND " to the regex above.
+CROSS_SEPARATOR_TRANS = str.maketrans({"/": " & ", "@": " & "})
+
+
 def _clean_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return WHITESPACE_RE.sub(" ", s or "").strip()
 
 
 def _strip_cad_road_discriminator(value: str | None) -> str:
@@ -1278,7 +1878,7 @@ def _normalize_location_token(value: str | None) -> str:
 
 
 def _is_generic_cross_token(value: str | None) -> bool:
-    token = re.sub(r"[^A-Z0-9]+", " ", _clean_ws(value or "").upper()).strip()
+    token = NON_ALNUM_RUN_RE.sub(" ", _clean_ws(value or "").upper()).strip()
     return token in GENERIC_CROSS_TOKENS
 
 
@@ -1299,8 +1899,8 @@ def _split_cross_tokens(text: str | None) -> list[str]:
         return []
 
     # Normalize separators to '&'
-    s = s.replace("/", " & ").replace("@", " & ")
-    s = re.sub(r"\s+\band\b\s+", " & ", s, flags=re.IGNORECASE)
+    s = s.translate(CROSS_SEPARATOR_TRANS)
+    s = CROSS_AND_SEPARATOR_RE.sub(" & ", s)
     s = _clean_ws(s)
 
     parts = [p.strip(" ,") for p in s.split("&")]
@@ -1344,6 +1944,16 @@ def _haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return 2 * r * math.asin(math.sqrt(a))
 
 
+def _small_dist_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Equirectangular distance in meters; within a meter of haversine at the
+    tens-of-meters scale used for geocode jitter thresholds."""
+    mean_lat = math.radians((lat1 + lat2) / 2)
+    return 6371000.0 * math.hypot(
+        math.radians(lat2 - lat1),
+        math.cos(mean_lat) * math.radians(lon2 - lon1),
+    )
+
+
 def _normalize_geocode_municipality(municipality: str | None, source: str | None) -> str:
     source_name = _normalize_source_name(source)
     city = _clean_ws(municipality or "")
@@ -1394,7 +2004,7 @@ def _locality_variants_for_geocoder(municipality: str | None, source: str | None
 
 def _road_signature(value: str | None) -> tuple[tuple[str, ...], frozenset[str]]:
     """Return comparable road-name words and explicit direction markers."""
-    raw_tokens = re.findall(r"[A-Z0-9]+", _clean_ws(value or "").upper())
+    raw_tokens = ROAD_TOKEN_RE.findall(_clean_ws(value or "").upper())
     name_tokens: list[str] = []
     directions: set[str] = set()
 
@@ -1490,7 +2100,7 @@ def _arcgis_intersection_roads(location) -> list[str]:
     street_part = match_address.split(",", 1)[0]
     split_roads = [
         _clean_ws(part)
-        for part in re.split(r"\s+(?:&|AND|AT)\s+", street_part, flags=re.IGNORECASE)
+        for part in ROAD_JOINER_RE.split(street_part)
         if _clean_ws(part)
     ]
     return split_roads[:2]
@@ -1647,14 +2257,14 @@ def _find_arcgis_intersection(
     cache_locality = locality_variants[0] if locality_variants else ()
     road_key = tuple(sorted((_normalize_location_token(road_a), _normalize_location_token(road_b))))
     cache_key = (source_name, road_key, cache_locality)
-    cached = geocode_intersection_cache.get(cache_key)
+    cached = _bounded_cache_get(geocode_intersection_cache, cache_key)
     if cached:
         return dict(cached)
 
     for locality_parts in locality_variants:
         query = ", ".join((f"{road_a} & {road_b}", *locality_parts))
         try:
-            locations = _as_location_list(geolocator_arcgis.geocode(
+            locations = _as_location_list(_arcgis_geocode(
                 query,
                 exactly_one=False,
                 timeout=3,
@@ -1685,7 +2295,7 @@ def _find_arcgis_intersection(
                 "query": query,
                 "score": _arcgis_score(location),
             }
-            geocode_intersection_cache[cache_key] = dict(result)
+            _bounded_cache_put(geocode_intersection_cache, cache_key, dict(result))
             return result
     return None
 
@@ -1700,7 +2310,7 @@ def _find_arcgis_street(
     for locality_parts in locality_variants:
         query = ", ".join((road, *locality_parts))
         try:
-            locations = _as_location_list(geolocator_arcgis.geocode(
+            locations = _as_location_list(_arcgis_geocode(
                 query,
                 exactly_one=False,
                 timeout=3,
@@ -1743,7 +2353,7 @@ def _find_arcgis_address(
     for locality_parts in locality_variants:
         query = ", ".join((address, *locality_parts))
         try:
-            locations = _as_location_list(geolocator_arcgis.geocode(
+            locations = _as_location_list(_arcgis_geocode(
                 query,
                 exactly_one=False,
                 timeout=3,
@@ -1788,6 +2398,20 @@ def _osm_matches_road(location, requested_road: str) -> bool:
     )
     return _road_name_matches(requested_road, returned_road)
 
+# Independent ArcGIS lookups for one incident (both ends of a segment or an
+# address range) run side by side. OSM stays sequential: it is only a
+# fallback and Nominatim's usage policy forbids parallel requests.
+_geocode_lookup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='geocode-lookup')
+
+
+def _run_geocode_lookups(calls: list[tuple]) -> list:
+    """Run (func, args) lookups concurrently; results keep call order."""
+    if len(calls) < 2:
+        return [func(*args) for func, args in calls]
+    futures = [_geocode_lookup_pool.submit(func, *args) for func, args in calls]
+    return [future.result() for future in futures]
+
+
 def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
     """
     Convert address to lat/lng coordinates.
@@ -1828,9 +2452,21 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
 
     # Cache key
     cache_key = f"{source_name}|{street_clean or ''}|{cross1 or ''}|{cross2 or ''}|{cache_locality}"
-    if cache_key in geocode_cache:
-        return geocode_cache[cache_key]
-
+    cached = _bounded_cache_get(geocode_cache, cache_key)
+    if cached is not None:
+        _count_geocode_cache('hits')
+        return cached
+    cached = _persistent_geocode_cache_get(cache_key)
+    if cached is not None:
+        _count_geocode_cache('persistent_hits')
+        _bounded_cache_put(geocode_cache, cache_key, cached)
+        return cached
+    _count_geocode_cache('misses')
+
+    # Shared with the pool threads in _run_geocode_lookups. They only ever set
+    # the one key to True (a single atomic dict store, never read-modify-write),
+    # and it is read here only after future.result() has joined them, so the
+    # unlocked writes cannot lose an update or be observed half-done.
     attempt_state = {"provider_responded": False}
 
     # EBR commonly publishes a block/address range bracketed by two streets.
@@ -1840,18 +2476,10 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
         range_start, range_end, range_road = address_range
         start_address = f"{range_start} {range_road}"
         end_address = f"{range_end} {range_road}"
-        start_match = _find_arcgis_address(
-            start_address,
-            locality_variants,
-            source_name,
-            attempt_state,
-        )
-        end_match = _find_arcgis_address(
-            end_address,
-            locality_variants,
-            source_name,
-            attempt_state,
-        )
+        start_match, end_match = _run_geocode_lookups([
+            (_find_arcgis_address, (start_address, locality_variants, source_name, attempt_state)),
+            (_find_arcgis_address, (end_address, locality_variants, source_name, attempt_state)),
+        ])
         if start_match and end_match:
             range_length = _haversine_m(
                 start_match['lat'], start_match['lng'],
@@ -1865,7 +2493,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
                     'quality': 'approximate-address-range',
                     'query': f"{start_match['query']} || {end_match['query']}",
                 }
-                geocode_cache[cache_key] = result
+                _remember_geocode(cache_key, result)
                 log(
                     f"  [ARC] address-range ({range_length:.0f}m) | "
                     f"{start_address} - {range_end} -> "
@@ -1891,7 +2519,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
             attempt_state,
         )
         if result:
-            geocode_cache[cache_key] = result
+            _remember_geocode(cache_key, result)
             log(f"  [ARC] address | {result['query']} -> ({result['lat']:.5f}, {result['lng']:.5f})")
             return result
 
@@ -1900,18 +2528,15 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
     # a high-score StreetName result is still only a fuzzy partial match.
     street_intersections: list[dict] = []
     if street_clean:
-        for cross in (cross1, cross2):
-            if not cross:
-                continue
-            match = _find_arcgis_intersection(
-                street_clean,
-                cross,
-                locality_variants,
-                source_name,
-                attempt_state,
+        matches = _run_geocode_lookups([
+            (
+                _find_arcgis_intersection,
+                (street_clean, cross, locality_variants, source_name, attempt_state),
             )
-            if match:
-                street_intersections.append(match)
+            for cross in (cross1, cross2)
+            if cross
+        ])
+        street_intersections = [match for match in matches if match]
 
     if len(street_intersections) >= 2:
         first, second = street_intersections[:2]
@@ -1926,7 +2551,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
                 'quality': 'street-segment',
                 'query': f"{first['query']} || {second['query']}",
             }
-            geocode_cache[cache_key] = result
+            _remember_geocode(cache_key, result)
             log(
                 f"  [ARC] street-segment ({segment_length:.0f}m) | "
                 f"{street_clean} @ {cross1} & {cross2} -> "
@@ -1940,7 +2565,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
         result = dict(street_intersections[0])
         result['quality'] = 'street+cross'
         result.pop('score', None)
-        geocode_cache[cache_key] = result
+        _remember_geocode(cache_key, result)
         log(f"  [ARC] street+cross | {result['query']} -> ({result['lat']:.5f}, {result['lng']:.5f})")
         return result
 
@@ -1958,7 +2583,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
             result = dict(match)
             result['quality'] = 'intersection-2'
             result.pop('score', None)
-            geocode_cache[cache_key] = result
+            _remember_geocode(cache_key, result)
             log(f"  [ARC] intersection-2 | {result['query']} -> ({result['lat']:.5f}, {result['lng']:.5f})")
             return result
 
@@ -1977,7 +2602,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
             road, quality, locality_variants, source_name, attempt_state
         )
         if result:
-            geocode_cache[cache_key] = result
+            _remember_geocode(cache_key, result)
             log(f"  [ARC] {quality} | {result['query']} -> ({result['lat']:.5f}, {result['lng']:.5f})")
             return result
 
@@ -1985,7 +2610,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
         for locality_parts in locality_variants:
             query = ", ".join((road, *locality_parts))
             try:
-                location = geolocator_osm.geocode(
+                location = _osm_geocode(
                     query,
                     country_codes='us',
                     exactly_one=True,
@@ -2006,7 +2631,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
                     'quality': quality,
                     'query': query,
                 }
-                geocode_cache[cache_key] = result
+                _remember_geocode(cache_key, result)
                 log(f"  [OSM] {quality} | {query} -> ({result['lat']:.5f}, {result['lng']:.5f})")
                 return result
             except Exception:
@@ -2024,7 +2649,7 @@ def geocode_address(street, cross_streets, municipality, source: str = 'caddo'):
         'provider_responded': attempt_state['provider_responded'],
     }
     if attempt_state['provider_responded']:
-        geocode_cache[cache_key] = unresolved
+        _remember_geocode(cache_key, unresolved)
     log(f"  [--] unresolved | {street_clean or '?'} @ {cross1 or '?'} {'& ' + cross2 if cross2 else ''}")
     return unresolved
 
@@ -2039,7 +2664,9 @@ def hash_incident(incident):
             f"{source}-{incident['agency']}-{incident['time']}-"
             f"{incident['description']}-{incident['street']}-{incident['cross_streets']}"
         )
-    return hashlib.md5(key.encode()).hexdigest()
+    # The digest is the stored dedup key in the live and archive databases,
+    # so the algorithm and hex format must not change.
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
 
 def scrape_caddo_incidents():
     """
@@ -2116,23 +2743,31 @@ NOLA_UNUSABLE_PUBLIC_LOCATIONS = {
 }
 
 
+NOLA_BLOCK_MASK_RE = re.compile(r"^(\d+)(X{2,})(?=\s)", re.IGNORECASE)
+NOLA_BLK_PREFIX_RE = re.compile(r"^(\d+)\s+BLK\s+", re.IGNORECASE)
+NOLA_GEOCODE_TEXT_FIXES = (
+    (re.compile(r"\bCHEF\s+MENTUER\b", re.IGNORECASE), "Chef Menteur"),
+    (re.compile(r"\bUS\s*(\d+)B\b", re.IGNORECASE), r"US \1 BUS"),
+    (re.compile(r"\bEARHART\s+ONRAMP\b", re.IGNORECASE), "Earhart Blvd"),
+)
+
+
 def _expand_public_block_number(value: str) -> str:
     """Turn a public block mask such as 035XX into a block anchor (3500)."""
     text = _clean_ws(value)
-    match = re.match(r"^(\d+)(X{2,})(?=\s)", text, flags=re.IGNORECASE)
+    match = NOLA_BLOCK_MASK_RE.match(text)
     if not match:
         return text
     block_number = int(match.group(1)) * (10 ** len(match.group(2)))
     expanded = f"{block_number}{text[match.end():]}"
-    return re.sub(r"^(\d+)\s+BLK\s+", r"\1 ", expanded, flags=re.IGNORECASE)
+    return NOLA_BLK_PREFIX_RE.sub(r"\1 ", expanded)
 
 
 def _normalize_new_orleans_geocode_text(value: str) -> str:
     """Normalize known public-feed notation without changing its display."""
     text = _clean_ws(value)
-    text = re.sub(r"\bCHEF\s+MENTUER\b", "Chef Menteur", text, flags=re.IGNORECASE)
-    text = re.sub(r"\bUS\s*(\d+)B\b", r"US \1 BUS", text, flags=re.IGNORECASE)
-    text = re.sub(r"\bEARHART\s+ONRAMP\b", "Earhart Blvd", text, flags=re.IGNORECASE)
+    for pattern, replacement in NOLA_GEOCODE_TEXT_FIXES:
+        text = pattern.sub(replacement, text)
     return text
 
 
@@ -2273,9 +2908,8 @@ def process_incidents(incidents, *, source: str = 'caddo', deactivate_missing: b
 
     source_default = _normalize_source_name(source)
     conn = db_connect()
-    cursor = conn.cursor()
     has_source_column = _ensure_incidents_source_column(conn)
-    now = datetime.now(timezone.utc).isoformat()
+    now = _utc_now_iso()
     current_hashes = set()
     ordered_incidents = list(incidents)
     if source_default == 'neworleans':
@@ -2283,9 +2917,253 @@ def process_incidents(incidents, *, source: str = 'caddo', deactivate_missing: b
         # points queryable immediately, before slower 0,0 location fallbacks.
         ordered_incidents.sort(key=_new_orleans_processing_priority)
 
-    for incident_index, incident in enumerate(ordered_incidents, start=1):
-        if source_default == 'neworleans' and incident_index > 1 and (incident_index - 1) % 25 == 0:
-            conn.commit()
+    incidents_by_hash = {}
+    for incident in ordered_incidents:
+        incident['source'] = _normalize_source_name(incident.get('source') if isinstance(incident, dict) else source_default)
+        incidents_by_hash.setdefault(hash_incident(incident), incident)
+    existing_rows, existing_cols = _load_existing_incident_rows(conn, list(incidents_by_hash))
+
+    if source_default == 'neworleans':
+        # Commit NOPD rows in small batches so the official points become
+        # queryable before the slower 0,0 location fallbacks are resolved.
+        batches = [ordered_incidents[i:i + 25] for i in range(0, len(ordered_incidents), 25)]
+        geocode_workers = 1
+    else:
+        batches = [ordered_incidents]
+        geocode_workers = GEOCODE_PREFETCH_WORKERS
+
+    try:
+        for batch_index, batch in enumerate(batches):
+            # Provider lookups happen before the write lock is taken, so the
+            # transaction itself never waits on the network.
+            pending_geocodes = {}
+            for incident in batch:
+                h = hash_incident(incident)
+                if _incident_needs_geocode(incident, incident['source'], existing_rows.get(h), existing_cols):
+                    pending_geocodes.setdefault(h, incident)
+            geo_by_hash = _resolve_incident_geocodes(pending_geocodes, max_workers=geocode_workers)
+
+            # IMMEDIATE takes the write lock up front so a concurrent reader can
+            # never force a busy-snapshot retry halfway through the batch.
+            conn.execute('BEGIN IMMEDIATE')
+            _geocode_cache_txn.conn = conn
+            try:
+                # Re-read this batch's rows under the lock: another writer (the
+                # archiver, a regeocode run) may have removed or added some
+                # since the pre-lock load. A vanished row must take the
+                # new-incident path so it gets a real first_seen, not an
+                # UPSERT built from an update tuple.
+                batch_hashes = list({hash_incident(incident) for incident in batch})
+                locked_rows, _ = _load_existing_incident_rows(conn, batch_hashes)
+                for h in batch_hashes:
+                    if h in locked_rows:
+                        existing_rows[h] = locked_rows[h]
+                    else:
+                        existing_rows.pop(h, None)
+                _process_incidents_in_transaction(
+                    conn,
+                    batch,
+                    source_default=source_default,
+                    now=now,
+                    current_hashes=current_hashes,
+                    existing_rows=existing_rows,
+                    existing_cols=existing_cols,
+                    geo_by_hash=geo_by_hash,
+                )
+                if deactivate_missing and batch_index == len(batches) - 1:
+                    _deactivate_missing_incidents(
+                        conn,
+                        current_hashes,
+                        source_default=source_default,
+                        has_source_column=has_source_column,
+                    )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                _geocode_cache_txn.conn = None
+    finally:
+        conn.close()
+        _bump_live_data_generation()
+    last_update = _utc_now_iso()
+    meta_set('last_update', last_update)
+
+
+def _load_existing_incident_rows(
+    conn: sqlite3.Connection,
+    hashes: list[str],
+) -> tuple[dict[str, tuple], str]:
+    """
+    Fetch the stored geocode state for every incoming hash in one query.
+
+    The hashes travel as a single JSON array bound to json_each(), so the SQL
+    text is identical for every batch size (one cached prepared statement) and
+    large New Orleans pulls never approach the bound-parameter limit.
+
+    Returns (rows_by_hash, schema) where schema is "versioned", "new" or "old"
+    and rows keep the column order process_incidents has always indexed into.
+    """
+    column_sets = (
+        ("versioned", 'id, latitude, longitude, geocode_source, geocode_quality, geocode_version, street'),
+        ("new", 'id, latitude, longitude, geocode_source, geocode_quality, street'),
+        ("old", 'id, latitude, longitude'),
+    )
+    for schema, columns in column_sets:
+        rows_by_hash: dict[str, tuple] = {}
+        try:
+            for row in conn.execute(
+                f'SELECT hash, {columns} FROM incidents '
+                'WHERE hash IN (SELECT value FROM json_each(?))',
+                (json.dumps(hashes),),
+            ):
+                rows_by_hash[row[0]] = tuple(row[1:])
+        except sqlite3.OperationalError:
+            if schema == "old":
+                raise
+            continue
+        return rows_by_hash, schema
+    return {}, "old"
+
+
+def _resolve_incident_geocodes(pending: dict[str, dict], *, max_workers: int) -> dict[str, dict]:
+    """Geocode the given feed rows ahead of the write transaction, keyed by hash."""
+    def _lookup(item):
+        h, incident = item
+        try:
+            return h, _incident_geocode_result(incident, incident['source'])
+        except Exception as e:
+            log(f"[WARN] Geocode prefetch failed: {e}")
+            return h, None
+
+    if max_workers <= 1 or len(pending) < 2:
+        results = map(_lookup, pending.items())
+        return {h: geo for h, geo in results if geo}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return {h: geo for h, geo in pool.map(_lookup, pending.items()) if geo}
+
+
+def _existing_geocode_state(existing: tuple, existing_cols: str) -> dict:
+    """Name the stored geocode columns of a row from _load_existing_incident_rows."""
+    has_geocode_meta = existing_cols in ("new", "versioned")
+    return {
+        'lat': existing[1],
+        'lng': existing[2],
+        'source': existing[3] if has_geocode_meta and len(existing) > 3 else None,
+        'quality': existing[4] if has_geocode_meta and len(existing) > 4 else None,
+        'version': existing[5] if existing_cols == "versioned" and len(existing) > 5 else None,
+        'street': (
+            existing[6]
+            if existing_cols == "versioned" and len(existing) > 6
+            else existing[5]
+            if existing_cols == "new" and len(existing) > 5
+            else None
+        ),
+    }
+
+
+def _has_in_bounds_point(incident: dict, source_name: str) -> bool:
+    try:
+        return _is_in_source_bounds(
+            float(incident.get('latitude')), float(incident.get('longitude')), source_name
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def _reusable_new_orleans_approximation(incident: dict, state: dict) -> bool:
+    """A stored approximate NOPD point can be kept while the public label is unchanged."""
+    public_street, public_cross, _ = _new_orleans_public_location_parts(incident)
+    return (
+        not _has_in_bounds_point(incident, 'neworleans')
+        and bool(public_street or public_cross)
+        and state['lat'] is not None
+        and state['lng'] is not None
+        and str(state['quality'] or '').startswith('approximate-')
+        and state['version'] == GEOCODER_VERSION
+        and _clean_ws(state['street'] or '') == _clean_ws(incident.get('street') or '')
+    )
+
+
+def _regeocode_reasons(state: dict) -> tuple[bool, bool, bool]:
+    """Return (needs_geo, low_quality, stale_version) for a stored row."""
+    needs_geo = state['lat'] is None or state['lng'] is None
+    low_quality = (
+        state['source'] in (None, "fallback", "skipped", "unresolved")
+        or state['quality'] in (None, "fallback", "city-only", "cross-only", "unknown-location", "unresolved")
+    )
+    stale_version = state['version'] != GEOCODER_VERSION
+    return needs_geo, low_quality, stale_version
+
+
+def _incident_needs_geocode(
+    incident: dict,
+    incident_source: str,
+    existing: tuple | None,
+    existing_cols: str,
+) -> bool:
+    """Whether storing this feed row will consult the geocoder."""
+    if not existing:
+        return True
+    state = _existing_geocode_state(existing, existing_cols)
+    if incident_source == 'neworleans':
+        return not _reusable_new_orleans_approximation(incident, state)
+    if _has_in_bounds_point(incident, incident_source):
+        return False
+    needs_geo, low_quality, stale_version = _regeocode_reasons(state)
+    return (needs_geo or low_quality or stale_version) and bool(
+        incident.get('street') or incident.get('cross_streets')
+    )
+
+
+def _deactivate_missing_incidents(
+    conn: sqlite3.Connection,
+    current_hashes: set[str],
+    *,
+    source_default: str,
+    has_source_column: bool,
+) -> None:
+    """Mark active rows that dropped out of the feed inactive (source-scoped)."""
+    if not has_source_column and source_default != 'caddo':
+        return
+    cursor = conn.cursor()
+    cursor.execute('CREATE TEMP TABLE IF NOT EXISTS current_feed_hashes (hash TEXT PRIMARY KEY)')
+    cursor.execute('DELETE FROM current_feed_hashes')
+    cursor.executemany(
+        'INSERT OR IGNORE INTO current_feed_hashes (hash) VALUES (?)',
+        ((h,) for h in current_hashes),
+    )
+    stale_sql = (
+        'UPDATE incidents SET is_active = 0 '
+        'WHERE is_active = 1 AND hash NOT IN (SELECT hash FROM current_feed_hashes)'
+    )
+    if not has_source_column:
+        cursor.execute(stale_sql)
+    elif source_default == 'caddo':
+        cursor.execute(stale_sql + " AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '')")
+    else:
+        cursor.execute(stale_sql + ' AND source = ?', (source_default,))
+    cursor.execute('DELETE FROM current_feed_hashes')
+
+
+def _process_incidents_in_transaction(
+    conn: sqlite3.Connection,
+    ordered_incidents: list,
+    *,
+    source_default: str,
+    now: str,
+    current_hashes: set[str],
+    existing_rows: dict[str, tuple],
+    existing_cols: str,
+    geo_by_hash: dict[str, dict],
+) -> None:
+    """Upsert one feed pass; the caller owns the surrounding transaction."""
+    cursor = conn.cursor()
+    # Feed-field refreshes and inserts are queued and written with executemany;
+    # only the occasional geocode correction is issued row by row.
+    feed_updates: list[tuple] = []
+    new_rows: dict[str, tuple] = {}
+    for incident in ordered_incidents:
         incident_source = _normalize_source_name(incident.get('source') if isinstance(incident, dict) else source_default)
         incident['source'] = incident_source
         h = hash_incident(incident)
@@ -2295,97 +3173,34 @@ def process_incidents(incidents, *, source: str = 'caddo', deactivate_missing: b
         if not isinstance(occurred_at, str) or not _parse_iso_datetime(occurred_at):
             occurred_at = None
 
-        # Check if exists
-        try:
-            cursor.execute(
-                'SELECT id, latitude, longitude, geocode_source, geocode_quality, geocode_version, street FROM incidents WHERE hash = ?',
-                (h,)
-            )
-            existing = cursor.fetchone()
-            existing_cols = "versioned"
-        except sqlite3.OperationalError:
-            try:
-                cursor.execute(
-                    'SELECT id, latitude, longitude, geocode_source, geocode_quality, street FROM incidents WHERE hash = ?',
-                    (h,)
-                )
-                existing = cursor.fetchone()
-                existing_cols = "new"
-            except sqlite3.OperationalError:
-                cursor.execute('SELECT id, latitude, longitude FROM incidents WHERE hash = ?', (h,))
-                existing = cursor.fetchone()
-                existing_cols = "old"
-        
+        existing = existing_rows.get(h)
         if existing:
             # Unit assignments can change while the incident remains active.
             # Refresh mutable feed fields instead of freezing their first value.
-            try:
-                cursor.execute(
-                    '''UPDATE incidents
-                       SET last_seen = ?, is_active = ?, source = ?, agency = ?, time = ?, units = ?,
-                           description = ?, street = ?, cross_streets = ?, municipality = ?,
-                           first_seen = COALESCE(?, first_seen)
-                       WHERE hash = ?''',
-                    (
-                        now,
-                        desired_active,
-                        incident_source,
-                        incident.get('agency'),
-                        incident.get('time'),
-                        incident.get('units'),
-                        incident.get('description'),
-                        incident.get('street'),
-                        incident.get('cross_streets'),
-                        incident.get('municipality'),
-                        occurred_at,
-                        h,
-                    ),
-                )
-            except sqlite3.OperationalError:
-                cursor.execute(
-                    'UPDATE incidents SET last_seen = ?, is_active = ?, units = ? WHERE hash = ?',
-                    (now, desired_active, incident.get('units'), h),
-                )
+            feed_updates.append((
+                now,
+                desired_active,
+                incident_source,
+                incident.get('agency'),
+                incident.get('time'),
+                incident.get('units'),
+                incident.get('description'),
+                incident.get('street'),
+                incident.get('cross_streets'),
+                incident.get('municipality'),
+                occurred_at,
+                h,
+            ))
+            state = _existing_geocode_state(existing, existing_cols)
 
             if incident_source == 'neworleans':
                 # Re-apply NOPD's current point state on every import. If the
                 # official point is 0,0, fall back to the public block or
                 # intersection label and mark the result as approximate.
-                existing_lat = existing[1]
-                existing_lng = existing[2]
-                existing_quality = existing[4] if existing_cols in ("new", "versioned") and len(existing) > 4 else None
-                existing_version = existing[5] if existing_cols == "versioned" and len(existing) > 5 else None
-                existing_street = (
-                    existing[6]
-                    if existing_cols == "versioned" and len(existing) > 6
-                    else existing[5]
-                    if existing_cols == "new" and len(existing) > 5
-                    else None
-                )
-                raw_lat = incident.get('latitude')
-                raw_lng = incident.get('longitude')
-                try:
-                    has_official_point = _is_in_source_bounds(
-                        float(raw_lat), float(raw_lng), incident_source
-                    )
-                except (TypeError, ValueError):
-                    has_official_point = False
-
-                public_street, public_cross, _ = _new_orleans_public_location_parts(incident)
-                has_public_location = bool(public_street or public_cross)
-                reusable_approximation = (
-                    not has_official_point
-                    and has_public_location
-                    and existing_lat is not None
-                    and existing_lng is not None
-                    and str(existing_quality or '').startswith('approximate-')
-                    and existing_version == GEOCODER_VERSION
-                    and _clean_ws(existing_street or '') == _clean_ws(incident.get('street') or '')
-                )
-                if reusable_approximation:
+                if _reusable_new_orleans_approximation(incident, state):
                     continue
 
-                current_geo = _incident_geocode_result(incident, incident_source)
+                current_geo = geo_by_hash.get(h) or _incident_geocode_result(incident, incident_source)
                 has_current_coords = (
                     current_geo.get('lat') is not None
                     and current_geo.get('lng') is not None
@@ -2414,15 +3229,7 @@ def process_incidents(incidents, *, source: str = 'caddo', deactivate_missing: b
             # Some live adapters can publish their own authoritative map point
             # after the text row first appears. Re-apply that source point even
             # when a same-version geocoder fallback already exists.
-            raw_lat = incident.get('latitude')
-            raw_lng = incident.get('longitude')
-            try:
-                has_source_point = _is_in_source_bounds(
-                    float(raw_lat), float(raw_lng), incident_source
-                )
-            except (TypeError, ValueError):
-                has_source_point = False
-            if has_source_point:
+            if _has_in_bounds_point(incident, incident_source):
                 current_geo = _incident_geocode_result(incident, incident_source)
                 cursor.execute(
                     '''UPDATE incidents
@@ -2447,17 +3254,11 @@ def process_incidents(incidents, *, source: str = 'caddo', deactivate_missing: b
             # try again using the improved intersection logic. This keeps your DB, but improves
             # "bad" points over time.
             try:
-                existing_lat = existing[1]
-                existing_lng = existing[2]
-                existing_source = existing[3] if existing_cols in ("new", "versioned") and len(existing) > 3 else None
-                existing_quality = existing[4] if existing_cols in ("new", "versioned") and len(existing) > 4 else None
-                existing_version = existing[5] if existing_cols == "versioned" and len(existing) > 5 else None
-
-                needs_geo = (existing_lat is None or existing_lng is None)
-                low_quality = (existing_source in (None, "fallback", "skipped", "unresolved")) or (existing_quality in (None, "fallback", "city-only", "cross-only", "unknown-location", "unresolved"))
-                stale_version = existing_version != GEOCODER_VERSION
+                existing_lat = state['lat']
+                existing_lng = state['lng']
+                needs_geo, low_quality, stale_version = _regeocode_reasons(state)
                 if (needs_geo or low_quality or stale_version) and (incident.get('street') or incident.get('cross_streets')):
-                    geo = _incident_geocode_result(incident, incident_source)
+                    geo = geo_by_hash.get(h) or _incident_geocode_result(incident, incident_source)
                     if geo:
                         new_has_coords = geo.get('lat') is not None and geo.get('lng') is not None
                         provider_confirmed = new_has_coords or bool(geo.get('provider_responded'))
@@ -2466,7 +3267,7 @@ def process_incidents(incidents, *, source: str = 'caddo', deactivate_missing: b
                         )
                         if not needs_geo and new_has_coords:
                             try:
-                                dist_m = _haversine_m(float(existing_lat), float(existing_lng), float(geo['lat']), float(geo['lng']))
+                                dist_m = _small_dist_m(float(existing_lat), float(existing_lng), float(geo['lat']), float(geo['lng']))
                                 # Only overwrite if materially different (avoid churning minor provider jitter)
                                 if dist_m > 75:
                                     should_update = True
@@ -2499,106 +3300,150 @@ def process_incidents(incidents, *, source: str = 'caddo', deactivate_missing: b
             except Exception:
                 pass
         else:
-            # New incident - geocode and insert
-            geo = _incident_geocode_result(incident, incident_source)
+            # New incident - geocode and queue the insert. A hash repeated
+            # within one feed keeps its first geocode and its latest fields.
+            pending = new_rows.get(h)
+            if pending is not None:
+                geo = {
+                    'lat': pending[10],
+                    'lng': pending[11],
+                    'source': pending[14],
+                    'quality': pending[15],
+                    'query': pending[16],
+                }
+            else:
+                geo = geo_by_hash.get(h) or _incident_geocode_result(incident, incident_source)
             first_seen = occurred_at or now
-            try:
-                cursor.execute('''
-                    INSERT OR IGNORE INTO incidents 
-                    (hash, agency, time, units, description, street, cross_streets, municipality, source, is_active,
-                     latitude, longitude, first_seen, last_seen,
-                     geocode_source, geocode_quality, geocode_query, geocoded_at, geocode_version)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    h,
-                    incident['agency'],
-                    incident['time'],
-                    incident['units'],
-                    incident['description'],
-                    incident['street'],
-                    incident['cross_streets'],
-                    incident['municipality'],
-                    incident_source,
-                    desired_active,
-                    geo['lat'],
-                    geo['lng'],
-                    first_seen,
-                    now,
-                    geo.get('source'),
-                    geo.get('quality'),
-                    geo.get('query'),
-                    now,
-                    GEOCODER_VERSION,
-                ))
-            except sqlite3.OperationalError:
-                # Older schema: try insert without geocode metadata columns.
-                try:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO incidents 
-                        (hash, agency, time, units, description, street, cross_streets, municipality, source, is_active, latitude, longitude, first_seen, last_seen)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        h,
-                        incident['agency'],
-                        incident['time'],
-                        incident['units'],
-                        incident['description'],
-                        incident['street'],
-                        incident['cross_streets'],
-                        incident['municipality'],
-                        incident_source,
-                        desired_active,
-                        geo['lat'],
-                        geo['lng'],
-                        first_seen,
-                        now
-                    ))
-                except sqlite3.OperationalError:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO incidents 
-                        (hash, agency, time, units, description, street, cross_streets, municipality, latitude, longitude, first_seen, last_seen, is_active)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        h,
-                        incident['agency'],
-                        incident['time'],
-                        incident['units'],
-                        incident['description'],
-                        incident['street'],
-                        incident['cross_streets'],
-                        incident['municipality'],
-                        geo['lat'],
-                        geo['lng'],
-                        first_seen,
-                        now,
-                        desired_active,
-                    ))
+            new_rows[h] = (
+                h,
+                incident['agency'],
+                incident['time'],
+                incident['units'],
+                incident['description'],
+                incident['street'],
+                incident['cross_streets'],
+                incident['municipality'],
+                incident_source,
+                desired_active,
+                geo['lat'],
+                geo['lng'],
+                first_seen,
+                now,
+                geo.get('source'),
+                geo.get('quality'),
+                geo.get('query'),
+                now,
+                GEOCODER_VERSION,
+            )
+            if pending is not None:
+                continue
             if incident_source != 'neworleans':
                 log(f"New incident: {incident['description']} at {incident['street'] or incident['cross_streets']}")
 
-    if deactivate_missing:
-        # Mark incidents no longer in feed as inactive (source-scoped).
-        if not has_source_column:
-            if source_default != 'caddo':
-                active_hashes = []
-            else:
-                cursor.execute('SELECT hash FROM incidents WHERE is_active = 1')
-                active_hashes = [row[0] for row in cursor.fetchall()]
-        elif source_default == 'caddo':
-            cursor.execute("SELECT hash FROM incidents WHERE is_active = 1 AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '')")
-            active_hashes = [row[0] for row in cursor.fetchall()]
-        else:
-            cursor.execute('SELECT hash FROM incidents WHERE is_active = 1 AND source = ?', (source_default,))
-            active_hashes = [row[0] for row in cursor.fetchall()]
+    _flush_incident_writes(cursor, feed_updates, new_rows)
 
-        for h in active_hashes:
-            if h not in current_hashes:
-                cursor.execute('UPDATE incidents SET is_active = 0 WHERE hash = ?', (h,))
 
-    conn.commit()
-    conn.close()
-    last_update = datetime.now(timezone.utc).isoformat()
-    meta_set('last_update', last_update)
+def _flush_incident_writes(
+    cursor: sqlite3.Cursor,
+    feed_updates: list[tuple],
+    new_rows: dict[str, tuple],
+) -> None:
+    """Write queued feed refreshes and inserts, falling back for older schemas."""
+    if not feed_updates and not new_rows:
+        return
+    # Current schema: one UPSERT covers both refreshed and brand-new rows.
+    # Existing rows carry occurred_at in the first_seen slot and NULL geocode
+    # columns; stored coordinates always win, so a geocode only lands on a row
+    # that has none (e.g. one another writer inserted since we loaded it).
+    upsert_rows = [
+        (
+            row[11], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
+            row[2], row[1], None, None, row[10], row[0],
+            None, None, None, None, None,
+        )
+        for row in feed_updates
+    ]
+    upsert_rows.extend(new_rows.values())
+    try:
+        cursor.executemany('''
+            INSERT INTO incidents
+            (hash, agency, time, units, description, street, cross_streets, municipality, source, is_active,
+             latitude, longitude, first_seen, last_seen,
+             geocode_source, geocode_quality, geocode_query, geocoded_at, geocode_version)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(hash) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                is_active = excluded.is_active,
+                source = excluded.source,
+                agency = excluded.agency,
+                time = excluded.time,
+                units = excluded.units,
+                description = excluded.description,
+                street = excluded.street,
+                cross_streets = excluded.cross_streets,
+                municipality = excluded.municipality,
+                first_seen = COALESCE(excluded.first_seen, incidents.first_seen),
+                latitude = COALESCE(incidents.latitude, excluded.latitude),
+                longitude = COALESCE(incidents.longitude, excluded.longitude),
+                geocode_source = CASE WHEN incidents.latitude IS NULL AND excluded.latitude IS NOT NULL
+                    THEN excluded.geocode_source ELSE incidents.geocode_source END,
+                geocode_quality = CASE WHEN incidents.latitude IS NULL AND excluded.latitude IS NOT NULL
+                    THEN excluded.geocode_quality ELSE incidents.geocode_quality END,
+                geocode_query = CASE WHEN incidents.latitude IS NULL AND excluded.latitude IS NOT NULL
+                    THEN excluded.geocode_query ELSE incidents.geocode_query END,
+                geocoded_at = CASE WHEN incidents.latitude IS NULL AND excluded.latitude IS NOT NULL
+                    THEN excluded.geocoded_at ELSE incidents.geocoded_at END,
+                geocode_version = CASE WHEN incidents.latitude IS NULL AND excluded.latitude IS NOT NULL
+                    THEN excluded.geocode_version ELSE incidents.geocode_version END
+        ''', upsert_rows)
+        feed_updates.clear()
+        new_rows.clear()
+        return
+    except sqlite3.OperationalError:
+        pass
+
+    if feed_updates:
+        try:
+            cursor.executemany(
+                '''UPDATE incidents
+                   SET last_seen = ?, is_active = ?, source = ?, agency = ?, time = ?, units = ?,
+                       description = ?, street = ?, cross_streets = ?, municipality = ?,
+                       first_seen = COALESCE(?, first_seen)
+                   WHERE hash = ?''',
+                feed_updates,
+            )
+        except sqlite3.OperationalError:
+            cursor.executemany(
+                'UPDATE incidents SET last_seen = ?, is_active = ?, units = ? WHERE hash = ?',
+                [(row[0], row[1], row[5], row[11]) for row in feed_updates],
+            )
+        feed_updates.clear()
+
+    if new_rows:
+        rows = list(new_rows.values())
+        try:
+            cursor.executemany('''
+                INSERT OR IGNORE INTO incidents
+                (hash, agency, time, units, description, street, cross_streets, municipality, source, is_active,
+                 latitude, longitude, first_seen, last_seen,
+                 geocode_source, geocode_quality, geocode_query, geocoded_at, geocode_version)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        except sqlite3.OperationalError:
+            # Older schema: try insert without geocode metadata columns.
+            try:
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO incidents
+                    (hash, agency, time, units, description, street, cross_streets, municipality, source, is_active, latitude, longitude, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [row[:14] for row in rows])
+            except sqlite3.OperationalError:
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO incidents
+                    (hash, agency, time, units, description, street, cross_streets, municipality, latitude, longitude, first_seen, last_seen, is_active)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [row[:8] + (row[10], row[11], row[12], row[13], row[9]) for row in rows])
+        new_rows.clear()
 
 
 def _store_feed_refresh(source: str, refreshed_at_text: str | None) -> None:
@@ -2607,18 +3452,19 @@ def _store_feed_refresh(source: str, refreshed_at_text: str | None) -> None:
         return
     source_name = _normalize_source_name(source)
     feed_refreshed_by_source[source_name] = refreshed_at_text
-    meta_set(f'feed_refreshed_at_{source_name}', refreshed_at_text)
+    updates = {f'feed_refreshed_at_{source_name}': refreshed_at_text}
     if source_name == 'caddo':
         # Keep old status field for backwards compatibility with frontend clients.
         feed_refreshed_at = refreshed_at_text
-        meta_set('feed_refreshed_at', refreshed_at_text)
+        updates['feed_refreshed_at'] = refreshed_at_text
+    meta_set_many(updates)
 
 
 def background_scrape():
     """Background task to scrape incidents periodically"""
     global feed_refreshed_at, last_scrape_started_at, last_scrape_finished_at
 
-    last_scrape_started_at = datetime.now(timezone.utc).isoformat()
+    last_scrape_started_at = _utc_now_iso()
     meta_set('last_scrape_started_at', last_scrape_started_at)
 
     source_jobs = [
@@ -2647,8 +3493,13 @@ def background_scrape():
         else:
             log(f"[{datetime.now().strftime('%H:%M:%S')}] No incidents found or scraping failed for {source_name}")
 
-    last_scrape_finished_at = datetime.now(timezone.utc).isoformat()
+    last_scrape_finished_at = _utc_now_iso()
     meta_set('last_scrape_finished_at', last_scrape_finished_at)
+    cache_info = geocode_cache_info()
+    log(
+        f"[GEO] cache {cache_info['currsize']}/{cache_info['maxsize']} | "
+        f"hits={cache_info['hits']} disk={cache_info['persistent_hits']} misses={cache_info['misses']}"
+    )
 
 
 VALID_SOURCES = {'caddo', 'lafayette', 'batonrouge', 'neworleans'}
@@ -2666,6 +3517,11 @@ def _normalize_incident_source_for_read(source: str | None) -> str:
 
 
 def _incidents_table_has_source_column(cursor: sqlite3.Cursor) -> bool:
+    # A column is never dropped once present, so pooled connections remember a
+    # positive answer instead of re-running PRAGMA table_info on every request.
+    conn = cursor.connection
+    if getattr(conn, 'has_source_column', False):
+        return True
     try:
         cursor.execute("PRAGMA table_info(incidents)")
         rows = cursor.fetchall() or []
@@ -2674,6 +3530,10 @@ def _incidents_table_has_source_column(cursor: sqlite3.Cursor) -> bool:
     for row in rows:
         col_name = row["name"] if isinstance(row, sqlite3.Row) else row[1]
         if str(col_name).strip().lower() == 'source':
+            try:
+                conn.has_source_column = True
+            except AttributeError:
+                pass  # plain sqlite3.Connection (archives) cannot carry attributes
             return True
     return False
 
@@ -2757,7 +3617,7 @@ def _load_month_incidents(month: str, source_filter: str) -> list[dict]:
     """Load incidents for a month from the main DB plus the month archive DB, if present."""
     incidents_by_hash: dict[str, dict] = {}
 
-    conn = db_connect(row_factory=True)
+    conn = db_read_connect()
     try:
         for row in _query_month_incidents_from_conn(conn, month, source_filter, ensure_source_column=True):
             key = str(row.get('hash') or f"main:{row.get('id')}")
@@ -2768,7 +3628,7 @@ def _load_month_incidents(month: str, source_filter: str) -> list[dict]:
 
     for archive_path in _get_archive_dbs_for_month(month):
         try:
-            archive_conn = _archive_db_connect(archive_path, row_factory=True)
+            archive_conn = db_read_connect(archive_path)
             try:
                 for row in _query_month_incidents_from_conn(archive_conn, month, source_filter):
                     key = str(row.get('hash') or f"{archive_path}:{row.get('id')}")
@@ -2893,7 +3753,7 @@ def _available_report_months(
 
     months: set[str] = set()
 
-    conn = db_connect(row_factory=True)
+    conn = db_read_connect()
     try:
         rows = _query_report_rows_from_conn(conn, source_filter, ensure_source_column=True)
     finally:
@@ -2909,7 +3769,7 @@ def _available_report_months(
 
     for archive_path in _list_archive_dbs():
         try:
-            archive_conn = _archive_db_connect(archive_path, row_factory=True)
+            archive_conn = db_read_connect(archive_path)
             try:
                 rows = _query_report_rows_from_conn(archive_conn, source_filter)
             finally:
@@ -2994,11 +3854,25 @@ def _build_hotspot_summary(incidents: list[dict], radius_miles: float) -> dict |
     best_cluster: list[tuple[dict, float, float, float]] = []
     best_avg_distance: float | None = None
 
-    for anchor_incident, anchor_lat, anchor_lon in points:
+    # Every anchor is compared with every point, so convert each point to
+    # radians once. The great-circle distance is never shorter than the
+    # latitude arc alone, which makes |dphi| a cheap, exact pre-filter.
+    earth_r = 6371000.0
+    max_dphi = radius_m / earth_r
+    prepared = [
+        (incident, lat, lon, math.radians(lat), math.radians(lon), math.cos(math.radians(lat)))
+        for incident, lat, lon in points
+    ]
+
+    for anchor_incident, anchor_lat, anchor_lon, p1, l1, cos_p1 in prepared:
         cluster: list[tuple[dict, float, float, float]] = []
         total_distance = 0.0
-        for incident, lat, lon in points:
-            dist_m = _haversine_m(anchor_lat, anchor_lon, lat, lon)
+        for incident, lat, lon, p2, l2, cos_p2 in prepared:
+            dphi = p2 - p1
+            if dphi > max_dphi or dphi < -max_dphi:
+                continue
+            a = math.sin(dphi / 2) ** 2 + cos_p1 * cos_p2 * math.sin((l2 - l1) / 2) ** 2
+            dist_m = 2 * earth_r * math.asin(math.sqrt(a))
             if dist_m <= radius_m:
                 cluster.append((incident, lat, lon, dist_m))
                 total_distance += dist_m
@@ -3117,7 +3991,7 @@ def _build_monthly_report(
         'month': month,
         'source': source_filter,
         'radiusMiles': radius_miles,
-        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'generatedAt': _utc_now_iso(),
         'isStatic': False,
         'totalIncidents': len(included_incidents),
         'rawIncidentCount': len(incidents),
@@ -3209,8 +4083,11 @@ REPORT_MAP_COLOR_TERMS = {
 }
 
 
+REPORT_TEXT_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _normalize_report_text(value: str | None) -> str:
-    return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9]+", " ", (value or "").lower())).strip()
+    return WHITESPACE_RE.sub(" ", REPORT_TEXT_NON_ALNUM_RE.sub(" ", (value or "").lower())).strip()
 
 
 def _report_text_includes_any(text: str, terms: list[str]) -> bool:
@@ -3320,7 +4197,7 @@ def _load_report_period_dataset(
         'incidents': incidents,
         'mappable': mappable,
         'colorCounts': color_counts,
-        'createdAt': datetime.now(timezone.utc).isoformat(),
+        'createdAt': _utc_now_iso(),
     }
     _report_period_cache[cache_key] = (now, dataset)
     if len(_report_period_cache) > 18:
@@ -3393,13 +4270,13 @@ def _geocode_report_address(address: str, source_filter: str) -> dict | None:
     best_out_of_scope: dict | None = None
     for query in queries[:4]:
         try:
-            location = geolocator_arcgis.geocode(query, timeout=5)
+            location = _arcgis_geocode(query, timeout=5)
         except Exception:
             location = None
         provider = 'arcgis'
         if not location:
             try:
-                location = geolocator_osm.geocode(query, country_codes='us', exactly_one=True, timeout=5)
+                location = _osm_geocode(query, country_codes='us', exactly_one=True, timeout=5)
                 provider = 'osm'
             except Exception:
                 continue
@@ -3571,9 +4448,21 @@ def _count_incidents_near(
         cell_size=cell_size,
     )
 
+    # Same test as _haversine_m(...) <= radius_m, with the target's trig hoisted
+    # out of the loop and the threshold moved into haversine space so each
+    # candidate skips the asin/sqrt.
+    p1 = math.radians(lat)
+    l1 = math.radians(lon)
+    cos_p1 = math.cos(p1)
+    max_a = math.sin(min(radius_m / 6371000.0, math.pi) / 2) ** 2
     count = 0
     for incident in candidates:
-        if _haversine_m(lat, lon, float(incident['_lat']), float(incident['_lon'])) <= radius_m:
+        p2 = math.radians(float(incident['_lat']))
+        a = (
+            math.sin((p2 - p1) / 2) ** 2
+            + cos_p1 * math.cos(p2) * math.sin((math.radians(float(incident['_lon'])) - l1) / 2) ** 2
+        )
+        if a <= max_a:
             count += 1
     return count
 
@@ -3773,19 +4662,62 @@ def monthly_reports_redirect():
 def healthz():
     return jsonify({'ok': True})
 
+# Dashboards poll the live endpoints far more often than the feed changes.
+# Serve the encoded JSON for a few seconds, and drop it as soon as a scrape or
+# archive pass writes new data.
+LIVE_RESPONSE_CACHE_TTL_SECONDS = float(_env_setting('LOUISIANA911_LIVE_CACHE_TTL_SECONDS', 'CADDO911_LIVE_CACHE_TTL_SECONDS', '5'))
+_live_response_cache: dict[tuple[str, ...], tuple[float, int, bytes]] = {}
+_live_data_generation = 0
+
+
+def _bump_live_data_generation() -> None:
+    global _live_data_generation
+    _live_data_generation += 1
+
+
+def _cached_live_json(cache_key: tuple[str, ...], build_payload):
+    cache_key = (DB_PATH, *cache_key)
+    now = time.monotonic()
+    generation = _live_data_generation
+    cached = _live_response_cache.get(cache_key)
+    if cached and cached[1] == generation and now - cached[0] <= LIVE_RESPONSE_CACHE_TTL_SECONDS:
+        return app.response_class(cached[2], mimetype='application/json')
+    # Encode through the app's JSON provider (orjson when installed) so cached
+    # bodies match jsonify; compact separators match its non-debug output.
+    body = app.json.dumps(build_payload(), separators=(',', ':')).encode()
+    if LIVE_RESPONSE_CACHE_TTL_SECONDS > 0:
+        _live_response_cache[cache_key] = (now, generation, body)
+    return app.response_class(body, mimetype='application/json')
+
+
 @app.route('/api/incidents/active')
 def get_active_incidents():
     source_filter = _normalize_source_filter(request.args.get('source'))
-    conn = db_connect(row_factory=True)
+    return _cached_live_json(
+        ('active', source_filter),
+        lambda: _active_incidents_payload(source_filter),
+    )
+
+
+# Columns the map and list actually render. geocode_query, geocoded_at and
+# geocode_version are bookkeeping for re-geocoding and stay server-side.
+ACTIVE_INCIDENT_COLUMNS = (
+    'id, hash, agency, time, units, description, street, cross_streets, municipality, source, '
+    'latitude, longitude, first_seen, last_seen, is_active, geocode_source, geocode_quality'
+)
+
+
+def _active_incidents_payload(source_filter: str) -> list[dict]:
+    conn = db_read_connect()
     cursor = conn.cursor()
     has_source_column = _ensure_incidents_source_column(conn)
     try:
         if source_filter == 'all' or not has_source_column:
-            cursor.execute('SELECT * FROM incidents WHERE is_active = 1 ORDER BY time DESC')
+            cursor.execute(f'SELECT {ACTIVE_INCIDENT_COLUMNS} FROM incidents WHERE is_active = 1 ORDER BY time DESC')
         elif source_filter == 'caddo':
-            cursor.execute("SELECT * FROM incidents WHERE is_active = 1 AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '') ORDER BY time DESC")
+            cursor.execute(f"SELECT {ACTIVE_INCIDENT_COLUMNS} FROM incidents WHERE is_active = 1 AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '') ORDER BY time DESC")
         else:
-            cursor.execute('SELECT * FROM incidents WHERE is_active = 1 AND source = ? ORDER BY time DESC', (source_filter,))
+            cursor.execute(f'SELECT {ACTIVE_INCIDENT_COLUMNS} FROM incidents WHERE is_active = 1 AND source = ? ORDER BY time DESC', (source_filter,))
         incidents = [dict(row) for row in cursor.fetchall()]
     except sqlite3.OperationalError:
         cursor.execute('SELECT * FROM incidents WHERE is_active = 1 ORDER BY time DESC')
@@ -3795,7 +4727,7 @@ def get_active_incidents():
     if source_filter != 'all':
         incidents = [incident for incident in incidents if _incident_matches_source_filter(incident, source_filter)]
     conn.close()
-    return jsonify(incidents)
+    return incidents
 
 @app.route('/api/incidents/history')
 def get_history():
@@ -3812,12 +4744,16 @@ def get_history():
 
     if not date:
         return jsonify({'error': 'date is required (YYYY-MM-DD)'}), 400
+    # No row past offset + limit in any single database can land on this page,
+    # so each query stops there and only those rows are merged below.
+    page_end = offset + limit
 
-    all_incidents: list[dict] = []
+    # Rows stay sqlite3.Row until the page is cut; only returned rows become dicts.
+    all_incidents: list[sqlite3.Row] = []
     total = 0
 
     # Query main database
-    conn = db_connect(row_factory=True)
+    conn = db_read_connect()
     cursor = conn.cursor()
     has_source_column = _ensure_incidents_source_column(conn)
 
@@ -3827,27 +4763,27 @@ def get_history():
             start_utc, end_utc = bounds
             if source_filter == 'all':
                 cursor.execute(
-                    'SELECT * FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? ORDER BY first_seen DESC',
-                    (start_utc, end_utc)
+                    'SELECT * FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? ORDER BY first_seen DESC LIMIT ?',
+                    (start_utc, end_utc, page_end)
                 )
             elif source_filter == 'caddo' and has_source_column:
                 cursor.execute(
-                    "SELECT * FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '') ORDER BY first_seen DESC",
-                    (start_utc, end_utc)
+                    "SELECT * FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '') ORDER BY first_seen DESC LIMIT ?",
+                    (start_utc, end_utc, page_end)
                 )
             elif source_filter == 'caddo':
                 cursor.execute(
-                    'SELECT * FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? ORDER BY first_seen DESC',
-                    (start_utc, end_utc)
+                    'SELECT * FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? ORDER BY first_seen DESC LIMIT ?',
+                    (start_utc, end_utc, page_end)
                 )
             elif not has_source_column:
                 cursor.execute('SELECT * FROM incidents WHERE 1 = 0')
             else:
                 cursor.execute(
-                    'SELECT * FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? AND source = ? ORDER BY first_seen DESC',
-                    (start_utc, end_utc, source_filter)
+                    'SELECT * FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? AND source = ? ORDER BY first_seen DESC LIMIT ?',
+                    (start_utc, end_utc, source_filter, page_end)
                 )
-            all_incidents.extend([dict(row) for row in cursor.fetchall()])
+            all_incidents.extend(cursor.fetchall())
             if source_filter == 'all':
                 cursor.execute(
                     'SELECT COUNT(*) as count FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ?',
@@ -3882,7 +4818,7 @@ def get_history():
             cursor.execute('SELECT * FROM incidents WHERE 1 = 0')
         else:
             cursor.execute('SELECT * FROM incidents WHERE is_active = 0 AND source = ? ORDER BY first_seen DESC', (source_filter,))
-        all_incidents.extend([dict(row) for row in cursor.fetchall()])
+        all_incidents.extend(cursor.fetchall())
         if source_filter == 'all':
             cursor.execute('SELECT COUNT(*) as count FROM incidents WHERE is_active = 0')
         elif source_filter == 'caddo' and has_source_column:
@@ -3901,17 +4837,16 @@ def get_history():
         archive_dbs = _get_archive_dbs_for_date(date)
         for archive_path in archive_dbs:
             try:
-                archive_conn = _archive_db_connect(archive_path, row_factory=True)
+                archive_conn = db_read_connect(archive_path)
                 archive_cursor = archive_conn.cursor()
-                bounds = _central_date_bounds_utc(date)
                 if bounds:
                     start_utc, end_utc = bounds
                     if source_filter == 'all':
                         archive_cursor.execute(
-                            'SELECT * FROM incidents WHERE first_seen >= ? AND first_seen < ? ORDER BY first_seen DESC',
-                            (start_utc, end_utc)
+                            'SELECT * FROM incidents WHERE first_seen >= ? AND first_seen < ? ORDER BY first_seen DESC LIMIT ?',
+                            (start_utc, end_utc, page_end)
                         )
-                        rows = [dict(row) for row in archive_cursor.fetchall()]
+                        rows = archive_cursor.fetchall()
                         archive_cursor.execute(
                             'SELECT COUNT(*) as count FROM incidents WHERE first_seen >= ? AND first_seen < ?',
                             (start_utc, end_utc)
@@ -3923,10 +4858,10 @@ def get_history():
                         source_args = (source_filter,) if source_filter != 'caddo' else tuple()
                         try:
                             archive_cursor.execute(
-                                f'SELECT * FROM incidents WHERE first_seen >= ? AND first_seen < ? AND {source_sql} ORDER BY first_seen DESC',
-                                (start_utc, end_utc, *source_args)
+                                f'SELECT * FROM incidents WHERE first_seen >= ? AND first_seen < ? AND {source_sql} ORDER BY first_seen DESC LIMIT ?',
+                                (start_utc, end_utc, *source_args, page_end)
                             )
-                            rows = [dict(row) for row in archive_cursor.fetchall()]
+                            rows = archive_cursor.fetchall()
                             archive_cursor.execute(
                                 f'SELECT COUNT(*) as count FROM incidents WHERE first_seen >= ? AND first_seen < ? AND {source_sql}',
                                 (start_utc, end_utc, *source_args)
@@ -3939,10 +4874,10 @@ def get_history():
                                 rows = []
                             else:
                                 archive_cursor.execute(
-                                    'SELECT * FROM incidents WHERE first_seen >= ? AND first_seen < ? ORDER BY first_seen DESC',
-                                    (start_utc, end_utc)
+                                    'SELECT * FROM incidents WHERE first_seen >= ? AND first_seen < ? ORDER BY first_seen DESC LIMIT ?',
+                                    (start_utc, end_utc, page_end)
                                 )
-                                rows = [dict(row) for row in archive_cursor.fetchall()]
+                                rows = archive_cursor.fetchall()
                                 archive_cursor.execute(
                                     'SELECT COUNT(*) as count FROM incidents WHERE first_seen >= ? AND first_seen < ?',
                                     (start_utc, end_utc)
@@ -3954,15 +4889,85 @@ def get_history():
             except Exception as e:
                 log(f"[ARCHIVE] Error reading {archive_path}: {e}")
 
-    for incident in all_incidents:
+    # Merge the per-database pages by first_seen descending, then paginate
+    all_incidents.sort(key=lambda row: row['first_seen'] or '', reverse=True)
+    paginated = []
+    for row in all_incidents[offset:offset + limit]:
+        incident = dict(row)
         incident['source'] = _normalize_incident_source_for_read(incident.get('source'))
-
-    # Sort all incidents by first_seen descending, then apply pagination
-    all_incidents.sort(key=lambda x: x.get('first_seen') or '', reverse=True)
-    paginated = all_incidents[offset:offset + limit]
+        paginated.append(incident)
 
     return jsonify({'incidents': paginated, 'total': total})
 
+# Archive files only change when the archive job appends to them, so the
+# per-day calendar counts are kept in memory and recomputed only when the
+# file (or its WAL) changes on disk.
+ARCHIVE_COUNTS_CACHE_MAX_ENTRIES = 256
+_archive_counts_cache: dict[tuple[str, str, str], tuple[tuple, dict[str, int]]] = {}
+
+
+def _archive_file_stamp(path: str) -> tuple:
+    stamp = []
+    for candidate in (path, f"{path}-wal"):
+        try:
+            st = os.stat(candidate)
+        except OSError:
+            stamp.append(None)
+            continue
+        stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def _archive_history_counts(archive_path: str, bounds: tuple[str, str], source_filter: str) -> dict[str, int]:
+    """Per-Central-day incident counts for one archive DB within bounds."""
+    start_utc, end_utc = bounds
+    cache_key = (archive_path, start_utc, source_filter)
+    stamp = _archive_file_stamp(archive_path)
+    cached = _archive_counts_cache.get(cache_key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    counts: dict[str, int] = {}
+    archive_conn = db_read_connect(archive_path)
+    try:
+        archive_cursor = archive_conn.cursor()
+        try:
+            if source_filter == 'all':
+                archive_cursor.execute(
+                    "SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE first_seen >= ? AND first_seen < ? GROUP BY hour",
+                    (start_utc, end_utc)
+                )
+            elif source_filter == 'caddo':
+                archive_cursor.execute(
+                    "SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE first_seen >= ? AND first_seen < ? AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '') GROUP BY hour",
+                    (start_utc, end_utc)
+                )
+            else:
+                archive_cursor.execute(
+                    "SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE first_seen >= ? AND first_seen < ? AND source = ? GROUP BY hour",
+                    (start_utc, end_utc, source_filter)
+                )
+        except sqlite3.OperationalError:
+            # Legacy archive DBs are Caddo-only and have no source column.
+            if source_filter != 'caddo':
+                return counts
+            archive_cursor.execute(
+                "SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE first_seen >= ? AND first_seen < ? GROUP BY hour",
+                (start_utc, end_utc)
+            )
+        for row in archive_cursor.fetchall():
+            day = _central_day_for_utc_hour(row['hour'])
+            if day:
+                counts[day] = counts.get(day, 0) + row['count']
+    finally:
+        archive_conn.close()
+
+    if len(_archive_counts_cache) >= ARCHIVE_COUNTS_CACHE_MAX_ENTRIES:
+        _archive_counts_cache.clear()
+    _archive_counts_cache[cache_key] = (stamp, counts)
+    return counts
+
+
 @app.route('/api/incidents/history_counts')
 def get_history_counts():
     ui_guard = _history_ui_request_guard()
@@ -3979,79 +4984,49 @@ def get_history_counts():
     bounds = _central_month_bounds_utc(month)
     
     # Query main database
-    conn = db_connect(row_factory=True)
+    conn = db_read_connect()
     cursor = conn.cursor()
     has_source_column = _ensure_incidents_source_column(conn)
     if bounds:
         start_utc, end_utc = bounds
         if source_filter == 'all':
             cursor.execute(
-                'SELECT first_seen FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ?',
+                "SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? GROUP BY hour",
                 (start_utc, end_utc)
             )
         elif source_filter == 'caddo' and has_source_column:
             cursor.execute(
-                "SELECT first_seen FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '')",
+                "SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '') GROUP BY hour",
                 (start_utc, end_utc)
             )
         elif source_filter == 'caddo':
             cursor.execute(
-                'SELECT first_seen FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ?',
+                "SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? GROUP BY hour",
                 (start_utc, end_utc)
             )
         elif not has_source_column:
-            cursor.execute('SELECT first_seen FROM incidents WHERE 1 = 0')
+            cursor.execute("SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE 1 = 0 GROUP BY hour")
         else:
             cursor.execute(
-                'SELECT first_seen FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? AND source = ?',
+                "SELECT strftime('%Y-%m-%dT%H', first_seen) AS hour, COUNT(*) AS count FROM incidents WHERE is_active = 0 AND first_seen >= ? AND first_seen < ? AND source = ? GROUP BY hour",
                 (start_utc, end_utc, source_filter)
             )
         for row in cursor.fetchall():
-            day = _central_date_key(row['first_seen'])
+            day = _central_day_for_utc_hour(row['hour'])
             if day:
-                counts[day] = counts.get(day, 0) + 1
+                counts[day] = counts.get(day, 0) + row['count']
     conn.close()
     
     # Also query archive database if it exists for this month
-    archive_dbs = _get_archive_dbs_for_month(month)
-    for archive_path in archive_dbs:
-        try:
-            archive_conn = _archive_db_connect(archive_path, row_factory=True)
-            archive_cursor = archive_conn.cursor()
-            if bounds:
-                start_utc, end_utc = bounds
-                try:
-                    if source_filter == 'all':
-                        archive_cursor.execute(
-                            'SELECT first_seen FROM incidents WHERE first_seen >= ? AND first_seen < ?',
-                            (start_utc, end_utc)
-                        )
-                    elif source_filter == 'caddo':
-                        archive_cursor.execute(
-                            "SELECT first_seen FROM incidents WHERE first_seen >= ? AND first_seen < ? AND (source = 'caddo' OR source IS NULL OR TRIM(source) = '')",
-                            (start_utc, end_utc)
-                        )
-                    else:
-                        archive_cursor.execute(
-                            'SELECT first_seen FROM incidents WHERE first_seen >= ? AND first_seen < ? AND source = ?',
-                            (start_utc, end_utc, source_filter)
-                        )
-                except sqlite3.OperationalError:
-                    # Legacy archive DBs are Caddo-only and have no source column.
-                    if source_filter != 'caddo':
-                        archive_conn.close()
-                        continue
-                    archive_cursor.execute(
-                        'SELECT first_seen FROM incidents WHERE first_seen >= ? AND first_seen < ?',
-                        (start_utc, end_utc)
-                    )
-                for row in archive_cursor.fetchall():
-                    day = _central_date_key(row['first_seen'])
-                    if day:
-                        counts[day] = counts.get(day, 0) + 1
-            archive_conn.close()
-        except Exception as e:
-            log(f"[ARCHIVE] Error reading {archive_path}: {e}")
+    if bounds:
+        for archive_path in _get_archive_dbs_for_month(month):
+            try:
+                archive_counts = _archive_history_counts(archive_path, bounds, source_filter)
+            except Exception as e:
+                log(f"[ARCHIVE] Error reading {archive_path}: {e}")
+                continue
+            for day, count in archive_counts.items():
+                counts[day] = counts.get(day, 0) + count
 
     return jsonify({'counts': counts})
 
@@ -4295,11 +5270,26 @@ def get_map_report():
 
 @app.route('/api/stats')
 def get_stats():
-    conn = db_connect(row_factory=True)
+    return _cached_live_json(('stats',), _stats_payload)
+
+
+def _stats_payload() -> dict:
+    conn = db_read_connect()
     cursor = conn.cursor()
     
-    cursor.execute('SELECT COUNT(*) as count FROM incidents WHERE is_active = 1')
-    active = cursor.fetchone()['count']
+    # One pass over the active rows feeds the total and both breakdowns.
+    cursor.execute(
+        'SELECT agency, description, COUNT(*) as count FROM incidents '
+        'WHERE is_active = 1 GROUP BY agency, description'
+    )
+    active = 0
+    agency_counts: dict = {}
+    type_counts: dict = {}
+    for row in cursor.fetchall():
+        count = row['count']
+        active += count
+        agency_counts[row['agency']] = agency_counts.get(row['agency'], 0) + count
+        type_counts[row['description']] = type_counts.get(row['description'], 0) + count
     
     today = 0
     today_bounds = _central_date_bounds_utc(datetime.now(CENTRAL_TZ).date().isoformat())
@@ -4314,23 +5304,24 @@ def get_stats():
     cursor.execute('SELECT COUNT(*) as count FROM incidents')
     total = cursor.fetchone()['count']
     
-    cursor.execute('SELECT agency, COUNT(*) as count FROM incidents WHERE is_active = 1 GROUP BY agency')
-    by_agency = [dict(row) for row in cursor.fetchall()]
-    
-    cursor.execute('''
-        SELECT description, COUNT(*) as count FROM incidents 
-        WHERE is_active = 1 GROUP BY description ORDER BY count DESC LIMIT 10
-    ''')
-    by_type = [dict(row) for row in cursor.fetchall()]
-    
     conn.close()
-    return jsonify({
+
+    # Same shapes and ordering as the old GROUP BY queries (NULLs sort first).
+    by_agency = [
+        {'agency': agency, 'count': count}
+        for agency, count in sorted(agency_counts.items(), key=lambda item: (item[0] is not None, item[0] or ''))
+    ]
+    by_type = [
+        {'description': description, 'count': count}
+        for description, count in sorted(type_counts.items(), key=lambda item: (-item[1], item[0] or ''))[:10]
+    ]
+    return {
         'active': active,
         'today': today,
         'total': total,
         'byAgency': by_agency,
         'byType': by_type
-    })
+    }
 
 @app.route('/api/status')
 def get_status():
@@ -4347,12 +5338,12 @@ def get_status():
     ])
 
     interval_seconds = int(meta.get('scrape_interval_seconds') or scrape_interval_seconds)
-    now_central = datetime.now(CENTRAL_TZ)
+    server_now, central_tz_abbr, central_date = _status_clock()
 
-    last_update_dt = _parse_iso_datetime(meta.get('last_update') or last_update)
-    last_scrape_finished_dt = _parse_iso_datetime(meta.get('last_scrape_finished_at') or last_scrape_finished_at)
-    # Prefer scrape-finished time for "last update" display; otherwise fall back to last_update.
-    display_base = last_scrape_finished_dt or last_update_dt
+    last_update_display, last_update_tooltip = _last_update_labels(
+        meta.get('last_update') or last_update,
+        meta.get('last_scrape_finished_at') or last_scrape_finished_at,
+    )
 
     refreshed_by_source = {
         'caddo': meta.get('feed_refreshed_at_caddo') or feed_refreshed_by_source.get('caddo'),
@@ -4369,12 +5360,12 @@ def get_status():
         'feedRefreshedBySource': refreshed_by_source,
         'lastScrapeStartedAt': meta.get('last_scrape_started_at') or last_scrape_started_at,
         'lastScrapeFinishedAt': meta.get('last_scrape_finished_at') or last_scrape_finished_at,
-        'serverNow': datetime.now(timezone.utc).isoformat(),
+        'serverNow': server_now,
         # Central-time helpers for the UI (so clients always see Louisiana time, not browser locale)
-        'centralTzAbbr': ("CST" if CENTRAL_TZ_IS_FALLBACK else now_central.strftime("%Z")),
-        'centralDate': now_central.date().isoformat(),
-        'lastUpdateDisplay': _format_central_hms(display_base),
-        'lastUpdateTooltip': _format_central_tooltip(display_base),
+        'centralTzAbbr': central_tz_abbr,
+        'centralDate': central_date,
+        'lastUpdateDisplay': last_update_display,
+        'lastUpdateTooltip': last_update_tooltip,
         # milliseconds (frontend expects ms)
         'scrapeInterval': interval_seconds * 1000,
     })
@@ -4388,7 +5379,7 @@ def force_refresh():
             return jsonify({'error': 'refresh endpoint disabled'}), 403
 
         global feed_refreshed_at, last_scrape_started_at, last_scrape_finished_at
-        last_scrape_started_at = datetime.now(timezone.utc).isoformat()
+        last_scrape_started_at = _utc_now_iso()
         meta_set('last_scrape_started_at', last_scrape_started_at)
         total_count = 0
         for source_name, scraper in (
@@ -4400,7 +5391,7 @@ def force_refresh():
             _store_feed_refresh(source_name, refreshed_at_text)
             process_incidents(incidents, source=source_name)
             total_count += len(incidents)
-        last_scrape_finished_at = datetime.now(timezone.utc).isoformat()
+        last_scrape_finished_at = _utc_now_iso()
         meta_set('last_scrape_finished_at', last_scrape_finished_at)
         return jsonify({
             'success': True,
@@ -4427,6 +5418,13 @@ def _background_archive():
     except Exception as e:
         log(f"[{datetime.now().strftime('%H:%M:%S')}] Archive error: {e}")
 
+def _background_db_maintenance():
+    """Background task for nightly SQLite upkeep (runs after the archive job)."""
+    try:
+        run_db_maintenance()
+    except Exception as e:
+        log(f"[{datetime.now().strftime('%H:%M:%S')}] DB maintenance error: {e}")
+
 def _background_weekly_backup():
     """Background task to create weekly SQLite backup snapshots."""
     try:
@@ -4496,6 +5494,17 @@ def start_collector(
         )
         log(f"[LOUISIANA 911] Daily archive scheduled for 3:00 AM Central")
 
+    # SQLite upkeep - daily at 3:30 AM Central, after the archive pass
+    scheduler.add_job(
+        _background_db_maintenance,
+        'cron',
+        hour=3,
+        minute=30,
+        max_instances=1,
+        coalesce=True,
+        id='db_maintenance_job',
+    )
+
     # Weekly snapshot backup - Sunday night (Central)
     if enable_weekly_backup:
         scheduler.add_job(
@@ -4513,35 +5522,46 @@ def start_collector(
     scheduler.start()
     return scheduler
 
+WEB_SERVER_THREADS = max(1, int(_env_setting('LOUISIANA911_WEB_THREADS', 'CADDO911_WEB_THREADS', '8')))
+
+
 def run_webserver(*, host: str = '0.0.0.0', port: int = 3911) -> None:
     """Run the Flask web UI server (blocking)."""
     log(f"[LOUISIANA 911] Web UI running at http://localhost:{port}")
     log("            Press Ctrl+C to stop")
-    app.run(host=host, port=port, debug=False, use_reloader=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        log("[WARN] waitress is not installed; using the Flask development server")
+        app.run(host=host, port=port, debug=False, use_reloader=False, threaded=True)
+        return
+    serve(app, host=host, port=port, threads=WEB_SERVER_THREADS, ident='Louisiana911')
 
-def _read_key_nonblocking() -> str | None:
+def _start_key_reader() -> queue.Queue:
     """
-    Non-blocking key read.
-    - Windows: reads single key presses via msvcrt (no Enter needed)
-    - Other: falls back to reading stdin when available (may require Enter)
+    Read key presses on a daemon thread that blocks until input arrives.
+    - Windows: single key presses via msvcrt (no Enter needed)
+    - Other: characters from stdin (may require Enter)
+    The thread exits quietly when stdin is closed.
     """
-    if os.name == 'nt':
-        try:
-            import msvcrt  # type: ignore
-            if msvcrt.kbhit():
-                return msvcrt.getwch()
-        except Exception:
-            return None
-        return None
+    keys: queue.Queue = queue.Queue()
 
-    try:
-        import select
-        r, _, _ = select.select([sys.stdin], [], [], 0)
-        if r:
-            return sys.stdin.read(1)
-    except Exception:
-        return None
-    return None
+    def _reader() -> None:
+        while True:
+            try:
+                if os.name == 'nt':
+                    import msvcrt  # type: ignore
+                    key = msvcrt.getwch()
+                else:
+                    key = sys.stdin.read(1)
+            except Exception:
+                return
+            if not key:
+                return
+            keys.put(key)
+
+    Thread(target=_reader, name='key-reader', daemon=True).start()
+    return keys
 
 def run_interactive_mode(
     *,
@@ -4566,9 +5586,16 @@ def run_interactive_mode(
     log("[LOUISIANA 911] Event gather mode is running (collector only).")
     log("          Press '2' to start the web UI, 'q' to quit.")
 
+    keys = _start_key_reader()
+    # Block until a key arrives instead of polling. Windows lock waits are not
+    # interruptible by Ctrl+C, so wake there occasionally to let it through.
+    key_wait_seconds = 1.0 if os.name == 'nt' else None
     try:
         while True:
-            key = _read_key_nonblocking()
+            try:
+                key = keys.get(timeout=key_wait_seconds)
+            except queue.Empty:
+                continue
             if key:
                 key = key.strip().lower()
                 if key == '2':
@@ -4580,7 +5607,6 @@ def run_interactive_mode(
                         log("[LOUISIANA 911] Web UI already running.")
                 elif key in ('q',):
                     break
-            time.sleep(0.1)
     except KeyboardInterrupt:
         pass
     finally:
@@ -4606,7 +5632,12 @@ def run_gather_mode(
     log("[LOUISIANA 911] Collector-only mode running. Press Ctrl+C to stop.")
     try:
         while True:
-            time.sleep(1)
+            # The scheduler does all the work; sleep until a signal arrives
+            # rather than waking once a second. Windows has no signal.pause().
+            if hasattr(signal, 'pause'):
+                signal.pause()
+            else:
+                time.sleep(1)
     except KeyboardInterrupt:
         pass
     finally:
@@ -4616,10 +5647,59 @@ def run_gather_mode(
             pass
         log("[LOUISIANA 911] Collector stopped.")
 
-def run_regeocode(*, dry_run: bool = False, limit: int | None = None) -> None:
+def _flush_regeocode_updates(conn: sqlite3.Connection, pending_updates: list[tuple]) -> None:
+    """Write a batch of re-geocoded rows in one short write transaction."""
+    if not pending_updates:
+        return
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        try:
+            conn.executemany('''
+                UPDATE incidents 
+                SET latitude = ?, longitude = ?, geocode_source = ?, geocode_quality = ?, 
+                    geocode_query = ?, geocoded_at = ?, geocode_version = ?
+                WHERE id = ?
+            ''', pending_updates)
+        except sqlite3.OperationalError:
+            # Older schema
+            conn.executemany(
+                'UPDATE incidents SET latitude = ?, longitude = ? WHERE id = ?',
+                [(row[0], row[1], row[7]) for row in pending_updates],
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    _bump_live_data_generation()
+    pending_updates.clear()
+
+
+REGEOCODE_BATCH_SIZE = 25
+
+
+def _regeocode_lookup(row_dict: dict) -> dict:
+    """Geocode one stored incident the same way a fresh import would."""
+    # New Orleans needs the same public block-mask, intersection, and
+    # Approx Loc handling used during normal imports.
+    row_source = _normalize_source_name(row_dict.get('source') or 'caddo')
+    if row_source == 'neworleans':
+        nola_probe = dict(row_dict)
+        nola_probe['latitude'] = None
+        nola_probe['longitude'] = None
+        return _incident_geocode_result(nola_probe, row_source)
+    return geocode_address(
+        row_dict.get('street'),
+        row_dict.get('cross_streets'),
+        row_dict.get('municipality'),
+        source=row_source,
+    )
+
+
+def run_regeocode(*, dry_run: bool = False, limit: int | None = None, force: bool = False) -> None:
     """
     Re-geocode all incidents in the database using the improved geocoding logic.
     Useful for fixing historical bad geocodes (e.g., Bossier Parish false positives).
+    Cached answers from the current GEOCODER_VERSION are reused unless force=True.
     """
     init_db()
     conn = db_connect(row_factory=True)
@@ -4639,99 +5719,74 @@ def run_regeocode(*, dry_run: bool = False, limit: int | None = None) -> None:
     skipped = 0
     failed = 0
     
-    # Clear the geocode cache to force fresh lookups
-    geocode_cache.clear()
-    geocode_intersection_cache.clear()
+    # Persisted answers are keyed by GEOCODER_VERSION, so anything still cached
+    # already reflects the current logic. Only --regeocode-force starts cold.
+    if force:
+        clear_geocode_caches()
     
-    for i, row in enumerate(rows, 1):
-        # Convert Row to dict for easier access (handles missing columns gracefully)
-        row_dict = dict(row)
-        incident_id = row_dict['id']
-        street = row_dict.get('street')
-        cross_streets = row_dict.get('cross_streets')
-        municipality = row_dict.get('municipality')
-        old_lat = row_dict.get('latitude')
-        old_lng = row_dict.get('longitude')
-        old_source = row_dict.get('geocode_source')
-        old_quality = row_dict.get('geocode_quality')
-        old_version = row_dict.get('geocode_version')
-        desc = row_dict.get('description') or 'Unknown'
-        
-        # Skip if no address info at all
-        if not street and not cross_streets:
-            skipped += 1
-            continue
-        
-        try:
-            # Get new geocode. New Orleans needs the same public block-mask,
-            # intersection, and Approx Loc handling used during normal imports.
-            row_source = _normalize_source_name(row_dict.get('source') or 'caddo')
-            if row_source == 'neworleans':
-                nola_probe = dict(row_dict)
-                nola_probe['latitude'] = None
-                nola_probe['longitude'] = None
-                geo = _incident_geocode_result(nola_probe, row_source)
-            else:
-                geo = geocode_address(
-                    street,
-                    cross_streets,
-                    municipality,
-                    source=row_source,
-                )
-            new_lat = geo.get('lat')
-            new_lng = geo.get('lng')
-            new_source = geo.get('source')
-            new_quality = geo.get('quality')
-            
-            # Check coordinate presence/distance plus metadata algorithm version.
-            old_has_coords = old_lat is not None and old_lng is not None
-            new_has_coords = new_lat is not None and new_lng is not None
-            provider_confirmed = new_has_coords or bool(geo.get('provider_responded'))
-            coordinates_changed = provider_confirmed and old_has_coords != new_has_coords
-            if old_has_coords and new_has_coords:
-                dist = _haversine_m(float(old_lat), float(old_lng), float(new_lat), float(new_lng))
-                coordinates_changed = dist > 50
-            changed = provider_confirmed and (
-                coordinates_changed or any((
-                    old_source != new_source,
-                    old_quality != new_quality,
-                    old_version != GEOCODER_VERSION,
-                ))
-            )
-            
-            # Log progress
-            status = "CHANGED" if changed else "same"
-            if changed and not dry_run:
-                now = datetime.now(timezone.utc).isoformat()
+    # The read above must not pin a snapshot for the whole run; updates are
+    # committed in short batches so the collector can write in between.
+    conn.commit()
+    pending_updates: list[tuple] = []
+    # Lookups for a batch run on a few worker threads (network-bound, and the
+    # OSM fallback keeps its own one-per-second gate); comparisons and writes
+    # stay on this thread.
+    with ThreadPoolExecutor(max_workers=GEOCODE_PREFETCH_WORKERS, thread_name_prefix='regeocode') as pool:
+        for batch_start in range(0, total, REGEOCODE_BATCH_SIZE):
+            batch = []
+            for row in rows[batch_start:batch_start + REGEOCODE_BATCH_SIZE]:
+                # Convert Row to dict for easier access (handles missing columns gracefully)
+                row_dict = dict(row)
+                # Skip if no address info at all
+                if not row_dict.get('street') and not row_dict.get('cross_streets'):
+                    skipped += 1
+                    continue
+                batch.append((row_dict, pool.submit(_regeocode_lookup, row_dict)))
+
+            for row_dict, future in batch:
+                incident_id = row_dict['id']
+                old_lat = row_dict.get('latitude')
+                old_lng = row_dict.get('longitude')
                 try:
-                    cursor.execute('''
-                        UPDATE incidents 
-                        SET latitude = ?, longitude = ?, geocode_source = ?, geocode_quality = ?, 
-                            geocode_query = ?, geocoded_at = ?, geocode_version = ?
-                        WHERE id = ?
-                    ''', (new_lat, new_lng, new_source, new_quality, geo.get('query'), now, GEOCODER_VERSION, incident_id))
-                    updated += 1
-                except sqlite3.OperationalError:
-                    # Older schema
-                    cursor.execute('UPDATE incidents SET latitude = ?, longitude = ? WHERE id = ?',
-                                   (new_lat, new_lng, incident_id))
-                    updated += 1
-            elif changed:
-                updated += 1  # Count as "would update" in dry run
-            
-            # Progress every 25 incidents
-            if i % 25 == 0 or i == total:
-                log(f"[REGEOCODE] Progress: {i}/{total} ({updated} updated, {skipped} skipped)")
-                
-        except Exception as e:
-            failed += 1
-            log(f"[REGEOCODE] Error on incident {incident_id}: {e}")
-        
-        # Small delay to avoid hammering geocoding APIs
-        time.sleep(0.05)
-    
-    if not dry_run:
-        conn.commit()
+                    geo = future.result()
+                    new_lat = geo.get('lat')
+                    new_lng = geo.get('lng')
+                    new_source = geo.get('source')
+                    new_quality = geo.get('quality')
+
+                    # Check coordinate presence/distance plus metadata algorithm version.
+                    old_has_coords = old_lat is not None and old_lng is not None
+                    new_has_coords = new_lat is not None and new_lng is not None
+                    provider_confirmed = new_has_coords or bool(geo.get('provider_responded'))
+                    coordinates_changed = provider_confirmed and old_has_coords != new_has_coords
+                    if old_has_coords and new_has_coords:
+                        dist = _small_dist_m(float(old_lat), float(old_lng), float(new_lat), float(new_lng))
+                        coordinates_changed = dist > 50
+                    changed = provider_confirmed and (
+                        coordinates_changed or any((
+                            row_dict.get('geocode_source') != new_source,
+                            row_dict.get('geocode_quality') != new_quality,
+                            row_dict.get('geocode_version') != GEOCODER_VERSION,
+                        ))
+                    )
+
+                    if changed and not dry_run:
+                        now = _utc_now_iso()
+                        pending_updates.append(
+                            (new_lat, new_lng, new_source, new_quality, geo.get('query'), now, GEOCODER_VERSION, incident_id)
+                        )
+                        updated += 1
+                    elif changed:
+                        updated += 1  # Count as "would update" in dry run
+                except Exception as e:
+                    failed += 1
+                    log(f"[REGEOCODE] Error on incident {incident_id}: {e}")
+
+            _flush_regeocode_updates(conn, pending_updates)
+            done = min(batch_start + REGEOCODE_BATCH_SIZE, total)
+            log(f"[REGEOCODE] Progress: {done}/{total} ({updated} updated, {skipped} skipped)")
+
+    _flush_regeocode_updates(conn, pending_updates)
     conn.close()
     
     log(f"[REGEOCODE] Complete! Updated: {updated}, Skipped: {skipped}, Failed: {failed}")
@@ -4861,6 +5916,7 @@ def main() -> None:
     parser.add_argument("--regeocode", action="store_true", help="re-geocode all incidents in database using improved logic, then exit")
     parser.add_argument("--regeocode-dry-run", action="store_true", help="like --regeocode but don't save changes (preview only)")
     parser.add_argument("--regeocode-limit", type=int, default=None, help="limit re-geocoding to N most recent incidents")
+    parser.add_argument("--regeocode-force", action="store_true", help="with --regeocode, clear the geocode cache first so every address is looked up again")
     parser.add_argument("--archive", action="store_true", help=f"archive incidents older than {ARCHIVE_AFTER_DAYS} days to monthly DBs, then exit")
     parser.add_argument("--archive-dry-run", action="store_true", help="like --archive but don't move anything (preview only)")
     parser.add_argument("--no-auto-archive", action="store_true", help="disable daily automatic archiving (3 AM Central)")
@@ -4902,7 +5958,11 @@ def main() -> None:
 
     # Handle re-geocode modes (one-time, then exit)
     if args.regeocode or args.regeocode_dry_run:
-        run_regeocode(dry_run=args.regeocode_dry_run, limit=args.regeocode_limit)
+        run_regeocode(
+            dry_run=args.regeocode_dry_run,
+            limit=args.regeocode_limit,
+            force=args.regeocode_force,
+        )
         return
 
     # Handle one-time backup mode
@@ -0,0 +1,46 @@
+"""lxml helpers shared by the HTML table adapters (Caddo, Baton Rouge)."""
+
+from __future__ import annotations
+
+import lxml.html
+
+
+# BeautifulSoup's get_text() leaves these out; lxml's itertext() would not.
+NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+def _collect_text(element, parts: list[str]) -> None:
+    if element.text:
+        parts.append(element.text)
+    for child in element:
+        # Comments and processing instructions have a non-string tag.
+        if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+            _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+
+
+def text_fragments(node) -> list[str]:
+    """The text strings BeautifulSoup's get_text() would see under node, in order."""
+    if not len(node):
+        # Most cells are a bare text node; skip the tree walk for them.
+        return [node.text] if node.text else []
+    parts: list[str] = []
+    _collect_text(node, parts)
+    return parts
+
+
+def parse_response(response):
+    """
+    Parse a requests response into an lxml tree, decoded with the same charset
+    response.text would use (the Content-Type header, else requests' guess).
+    Left to itself lxml guesses from the bytes and mangles UTF-8 pages that
+    carry no <meta charset>, which would change stored text and dedup hashes.
+    """
+    encoding = response.encoding or response.apparent_encoding
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        # A charset libxml2 does not know; let requests decode it instead.
+        return lxml.html.fromstring(response.text)
+    return lxml.html.fromstring(response.content, parser=parser)
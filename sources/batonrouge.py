@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 import re
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from ._html import parse_response, text_fragments
 
 
 FEED_URL = "https://city.brla.gov/traffic/incidents.asp"
@@ -15,9 +16,20 @@ TRAFFIC_MAP_QUERY_URL = (
     "Traffic_Incident/MapServer/0/query"
 )
 
+# Shared across scrape cycles so the keep-alive connections to the City-Parish
+# site and its map server survive between polls instead of re-handshaking.
+_SCRAPE_SESSION = requests.Session()
+_SCRAPE_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
+_WS_RE = re.compile(r"\s+")
+_TIME_FALLBACK_RE = re.compile(r"(\d{1,2}):(\d{2})(?::\d{2})?\s*([AP]M)", re.IGNORECASE)
+_REFRESHED_AT_RE = re.compile(r"Last Updated\s+(.+?)\s+Number of incidents\s*:", re.IGNORECASE)
+_HOUSE_NUMBER_RE = re.compile(r"^\d+[A-Z-]*\s+", re.IGNORECASE)
+_MATCH_KEY_STRIP_RE = re.compile(r"[^A-Z0-9]+")
+
 
 def _clean_ws(value: str | None) -> str:
-    return re.sub(r"\s+", " ", value or "").strip()
+    return _WS_RE.sub(" ", value or "").strip()
 
 
 def _parse_time_to_hhmm(value: str | None) -> str:
@@ -25,14 +37,9 @@ def _parse_time_to_hhmm(value: str | None) -> str:
     if not text:
         return ""
 
-    for fmt in ("%I:%M:%S %p", "%I:%M %p"):
-        try:
-            return datetime.strptime(text, fmt).strftime("%H%M")
-        except Exception:
-            pass
-
-    # Fallback if upstream formatting shifts.
-    match = re.search(r"(\d{1,2}):(\d{2})(?::\d{2})?\s*([AP]M)", text, flags=re.IGNORECASE)
+    # The feed prints "8:05:12 AM" (sometimes without seconds); the pattern
+    # covers both, so skip strptime/strftime just to reformat two integers.
+    match = _TIME_FALLBACK_RE.search(text)
     if not match:
         return ""
 
@@ -48,11 +55,16 @@ def _parse_time_to_hhmm(value: str | None) -> str:
     return ""
 
 
-def _extract_refreshed_at_text(soup: BeautifulSoup) -> str | None:
-    text = _clean_ws(soup.get_text(" ", strip=True))
+def _node_text(node) -> str:
+    """Same text as BeautifulSoup's get_text(" ", strip=True), whitespace-collapsed."""
+    return _clean_ws(" ".join(text_fragments(node)))
+
+
+def _extract_refreshed_at_text(doc) -> str | None:
+    text = _node_text(doc)
     if not text:
         return None
-    match = re.search(r"Last Updated\s+(.+?)\s+Number of incidents\s*:", text, flags=re.IGNORECASE)
+    match = _REFRESHED_AT_RE.search(text)
     if match:
         return _clean_ws(match.group(1))
     return None
@@ -65,7 +77,7 @@ def _split_location(location: str, cross_street: str) -> tuple[str, str]:
 
     # A location such as "HOOPER RD / SULLIVAN RD" is an intersection, while
     # a leading house number is a normal street address and should stay whole.
-    if not re.match(r"^\d+[A-Z-]*\s+", location_clean, flags=re.IGNORECASE):
+    if not _HOUSE_NUMBER_RE.match(location_clean):
         parts = [_clean_ws(part) for part in location_clean.split("/", 1)]
         if len(parts) == 2 and all(parts):
             return parts[0], parts[1]
@@ -80,7 +92,7 @@ def _incident_match_key(
 ) -> tuple[str, str, str]:
     """Build a formatting-insensitive key shared by the HTML and map feeds."""
     return tuple(
-        re.sub(r"[^A-Z0-9]+", "", _clean_ws(value).upper())
+        _MATCH_KEY_STRIP_RE.sub("", _clean_ws(value).upper())
         for value in (description, street, cross_streets)
     )
 
@@ -142,7 +154,7 @@ def _merge_published_points(incidents: list[dict], features: list[dict]) -> None
 
 
 def _fetch_published_features(*, user_agent: str, timeout_seconds: int) -> list[dict]:
-    response = requests.get(
+    response = _SCRAPE_SESSION.get(
         TRAFFIC_MAP_QUERY_URL,
         params={
             "f": "json",
@@ -166,7 +178,7 @@ def _fetch_published_features(*, user_agent: str, timeout_seconds: int) -> list[
 
 
 def scrape(*, user_agent: str, timeout_seconds: int = 15) -> tuple[list[dict], str | None]:
-    response = requests.get(
+    response = _SCRAPE_SESSION.get(
         FEED_URL,
         headers={
             "User-Agent": user_agent,
@@ -176,20 +188,26 @@ def scrape(*, user_agent: str, timeout_seconds: int = 15) -> tuple[list[dict], s
     )
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    refreshed_at_text = _extract_refreshed_at_text(soup)
+    # lxml raises on an empty document; BeautifulSoup simply found no rows.
+    if not response.content.strip():
+        return [], None
+
+    # Walk the lxml tree directly, as the Caddo adapter does; the page only
+    # needs row/cell text, so BeautifulSoup's wrapper objects bought nothing.
+    doc = parse_response(response)
+    refreshed_at_text = _extract_refreshed_at_text(doc)
 
     incidents: list[dict] = []
-    for row in soup.find_all("tr"):
-        cells = row.find_all("td")
+    for row in doc.iter("tr"):
+        cells = list(row.iter("td"))
         if len(cells) < 5:
             continue
 
-        time_raw = _clean_ws(cells[0].get_text(" ", strip=True))
-        incident_type = _clean_ws(cells[1].get_text(" ", strip=True))
-        agency = _clean_ws(cells[2].get_text(" ", strip=True))
-        location = _clean_ws(cells[3].get_text(" ", strip=True))
-        cross_street = _clean_ws(cells[4].get_text(" ", strip=True))
+        time_raw = _node_text(cells[0])
+        incident_type = _node_text(cells[1])
+        agency = _node_text(cells[2])
+        location = _node_text(cells[3])
+        cross_street = _node_text(cells[4])
 
         if not incident_type:
             continue
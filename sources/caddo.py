@@ -2,12 +2,46 @@
 
 from __future__ import annotations
 
+import html
+import re
+
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._html import parse_response, text_fragments
 
 
 BASE_URL = "https://ias.ecc.caddo911.com/All_ActiveEvents.aspx"
 
+_REFRESHED_AT_RE = re.compile(r"Refreshed at:([^<]*)")
+
+# Shared across scrape cycles so the keep-alive connection and the ASP.NET
+# session cookie survive between polls instead of re-handshaking every minute.
+_SCRAPE_SESSION = requests.Session()
+_SCRAPE_SESSION.headers.update(
+    {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Connection": "keep-alive",
+    }
+)
+# A short retry absorbs the occasional 502/503 from the county's IIS front end
+# without waiting a whole scheduler interval for the next poll.
+_SCRAPE_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
+
+
+def _cell_text(cell) -> str:
+    """Same text as BeautifulSoup's get_text(strip=True): stripped fragments, joined."""
+    return "".join(fragment.strip() for fragment in text_fragments(cell))
+
 
 def scrape(*, user_agent: str, timeout_seconds: int = 15) -> tuple[list[dict], str | None]:
     """
@@ -16,67 +50,66 @@ def scrape(*, user_agent: str, timeout_seconds: int = 15) -> tuple[list[dict], s
     Returns:
       (incidents, refreshed_at_text)
     """
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive",
-        }
-    )
-
-    # First request establishes ASP.NET cookies.
-    response = session.get(BASE_URL, timeout=timeout_seconds, allow_redirects=True)
+    session = _SCRAPE_SESSION
+    headers = {"User-Agent": user_agent}
+
+    # First request establishes ASP.NET cookies; later cycles reuse them.
+    response = session.get(BASE_URL, headers=headers, timeout=timeout_seconds, allow_redirects=True)
     if "AspxAutoDetectCookieSupport" in response.url or response.status_code == 302:
-        response = session.get(f"{BASE_URL}?AspxAutoDetectCookieSupport=1", timeout=timeout_seconds)
+        response = session.get(
+            f"{BASE_URL}?AspxAutoDetectCookieSupport=1",
+            headers=headers,
+            timeout=timeout_seconds,
+        )
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
     incidents: list[dict] = []
     refreshed_at_text: str | None = None
 
-    for s in soup.stripped_strings:
-        if "Refreshed at:" in s:
-            refreshed_at_text = s.split("Refreshed at:", 1)[1].strip()
-            break
-
-    for table in soup.find_all("table"):
-        for row in table.find_all("tr"):
-            cells = row.find_all("td")
-            if len(cells) < 6:
-                continue
-
-            agency = cells[0].get_text(strip=True)
-            time_val = cells[1].get_text(strip=True)
-            units = cells[2].get_text(strip=True)
-            description = cells[3].get_text(strip=True)
-            street = cells[4].get_text(strip=True)
-            cross_streets = cells[5].get_text(strip=True)
-            municipality = cells[6].get_text(strip=True) if len(cells) > 6 else ""
-
-            # Ignore non-data rows/layout rows.
-            if not (
-                agency
-                and len(agency) <= 10
-                and time_val
-                and time_val.isdigit()
-                and len(time_val) <= 4
-                and description
-            ):
-                continue
-
-            incidents.append(
-                {
-                    "source": "caddo",
-                    "agency": agency,
-                    "time": time_val,
-                    "units": int(units) if units.isdigit() else 1,
-                    "description": description,
-                    "street": street,
-                    "cross_streets": cross_streets,
-                    "municipality": municipality,
-                }
-            )
+    refreshed_match = _REFRESHED_AT_RE.search(response.text)
+    if refreshed_match:
+        refreshed_at_text = html.unescape(refreshed_match.group(1)).strip()
+
+    # lxml raises on an empty document; BeautifulSoup simply found no rows.
+    if not response.content.strip():
+        return incidents, refreshed_at_text
+
+    # Parse straight into an lxml tree; BeautifulSoup's Python-side tree
+    # building dominated the scrape on this viewstate-heavy page.
+    doc = parse_response(response)
+    for row in doc.iter("tr"):
+        cells = list(row.iter("td"))
+        if len(cells) < 6:
+            continue
+
+        # Ignore non-data rows/layout rows. Check the cheap HHMM cell first
+        # so header and layout rows are rejected before extracting the rest.
+        time_val = _cell_text(cells[1])
+        if not (time_val.isdigit() and len(time_val) <= 4):
+            continue
+        agency = _cell_text(cells[0])
+        if not agency or len(agency) > 10:
+            continue
+        description = _cell_text(cells[3])
+        if not description:
+            continue
+
+        units = _cell_text(cells[2])
+        street = _cell_text(cells[4])
+        cross_streets = _cell_text(cells[5])
+        municipality = _cell_text(cells[6]) if len(cells) > 6 else ""
+
+        incidents.append(
+            {
+                "source": "caddo",
+                "agency": agency,
+                "time": time_val,
+                "units": int(units) if units.isdigit() else 1,
+                "description": description,
+                "street": street,
+                "cross_streets": cross_streets,
+                "municipality": municipality,
+            }
+        )
 
     return incidents, refreshed_at_text
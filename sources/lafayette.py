@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from functools import lru_cache
 import re
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 
 
 FEED_URL = "https://lafayette911.org/wp-json/traffic-feed/v1/data"
@@ -23,28 +24,47 @@ MUNICIPALITY_SUFFIXES = (
     "YOUNGSVILLE",
 )
 
+# Shared across scrape cycles so the keep-alive connection survives between
+# polls instead of re-handshaking every interval.
+_SCRAPE_SESSION = requests.Session()
+_SCRAPE_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+_WS_RE = re.compile(r"\s+")
+_HHMM_RE = re.compile(r"(\d{1,2}):(\d{2})")
+_MUNICIPALITY_SUFFIX_RE = re.compile(
+    r"\b(" + "|".join(re.escape(name) for name in MUNICIPALITY_SUFFIXES) + r")\s*,\s*LA\s*$",
+    re.IGNORECASE,
+)
+_ASSISTING_UNIT_RE = re.compile(r"\b(FIRE|POLICE|SHERIFF)\b")
+
+# Only table rows carry incidents; skip building the wrapper markup around them.
+ROW_STRAINER = SoupStrainer("tr")
+
 
 def _clean_ws(value: str | None) -> str:
-    return re.sub(r"\s+", " ", value or "").strip()
+    return _WS_RE.sub(" ", value or "").strip()
 
 
 def _parse_reported_time(value: str | None) -> str:
     text = _clean_ws(value)
     if not text:
         return ""
-    try:
-        dt = datetime.strptime(text, "%m/%d/%Y %H:%M")
-        return dt.strftime("%H%M")
-    except Exception:
+    # Expected "MM/DD/YYYY HH:MM"; only the clock part is kept.
+    _date_part, _, time_part = text.partition(" ")
+    hour_text, _, minute_text = time_part.partition(":")
+    if hour_text.isdigit() and minute_text.isdigit() and len(minute_text) == 2:
+        hour = int(hour_text)
+        minute = int(minute_text)
+    else:
         # Fallback to "HHMM" extraction if the timestamp format changes.
-        match = re.search(r"(\d{1,2}):(\d{2})", text)
+        match = _HHMM_RE.search(text)
         if not match:
             return ""
         hour = int(match.group(1))
         minute = int(match.group(2))
-        if 0 <= hour <= 23 and 0 <= minute <= 59:
-            return f"{hour:02d}{minute:02d}"
-        return ""
+    if 0 <= hour <= 23 and 0 <= minute <= 59:
+        return f"{hour:02d}{minute:02d}"
+    return ""
 
 
 def _split_location(value: str | None) -> tuple[str, str, str]:
@@ -55,22 +75,18 @@ def _split_location(value: str | None) -> tuple[str, str, str]:
     if not raw:
         return "", "", ""
 
+    # raw is already whitespace-collapsed, so slices of it only need strip().
     municipality = ""
     base = raw
-    city_pattern = "|".join(re.escape(name) for name in MUNICIPALITY_SUFFIXES)
-    city_match = re.search(
-        rf"\b({city_pattern})\s*,\s*LA\s*$",
-        base,
-        flags=re.IGNORECASE,
-    )
+    city_match = _MUNICIPALITY_SUFFIX_RE.search(base)
     if city_match:
-        municipality = _clean_ws(city_match.group(1)).upper()
-        base = _clean_ws(base[: city_match.start()])
+        municipality = city_match.group(1).upper()
+        base = base[: city_match.start()].rstrip()
 
     if "/" in base:
         left, right = base.split("/", 1)
-        street = _clean_ws(left)
-        cross_streets = _clean_ws(right)
+        street = left.strip()
+        cross_streets = right.strip()
     else:
         street = base
         cross_streets = ""
@@ -78,13 +94,15 @@ def _split_location(value: str | None) -> tuple[str, str, str]:
     return street, cross_streets, municipality
 
 
+# Only a handful of FIRE/POLICE/SHERIFF combinations ever appear.
+@lru_cache(maxsize=64)
 def _normalize_assisting(value: str | None) -> str:
     raw = _clean_ws(value).upper()
     if not raw:
         return ""
 
     # Keep only known assisting units in feed order and present consistently.
-    matches = list(re.finditer(r"\b(FIRE|POLICE|SHERIFF)\b", raw))
+    matches = list(_ASSISTING_UNIT_RE.finditer(raw))
     if not matches:
         return raw
 
@@ -100,7 +118,7 @@ def _normalize_assisting(value: str | None) -> str:
 
 
 def scrape(*, user_agent: str, timeout_seconds: int = 15) -> tuple[list[dict], str | None]:
-    response = requests.get(
+    response = _SCRAPE_SESSION.get(
         FEED_URL,
         headers={"User-Agent": user_agent, "Accept": "application/json"},
         timeout=timeout_seconds,
@@ -112,7 +130,7 @@ def scrape(*, user_agent: str, timeout_seconds: int = 15) -> tuple[list[dict], s
         return [], None
 
     html = payload.get("data") or ""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=ROW_STRAINER)
 
     incidents: list[dict] = []
     rows = soup.find_all("tr")
@@ -266,6 +266,36 @@ class CanonicalOriginTests(unittest.TestCase):
         self.assertIn('SameSite=Strict', shell.headers.get('Set-Cookie', ''))
         self.assertEqual(400, unbounded_history.status_code)
 
+    def test_live_stats_cache_is_dropped_when_data_changes(self):
+        headers = {
+            'Host': 'localhost',
+            'Sec-Fetch-Site': 'same-origin',
+            'Sec-Fetch-Mode': 'cors',
+        }
+        original_db_path = app.DB_PATH
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                app.DB_PATH = os.path.join(tmp_dir, 'louisiana911.db')
+                app.init_db()
+                before = self.client.get('/api/stats', headers=headers).get_json()
+
+                conn = app.db_connect()
+                conn.execute(
+                    "INSERT INTO incidents (hash, agency, description, source, is_active) "
+                    "VALUES ('cache-test', 'SPD', 'ALARM', 'caddo', 1)"
+                )
+                conn.commit()
+                conn.close()
+                cached = self.client.get('/api/stats', headers=headers).get_json()
+                app._bump_live_data_generation()
+                fresh = self.client.get('/api/stats', headers=headers).get_json()
+        finally:
+            app.DB_PATH = original_db_path
+
+        self.assertEqual(0, before['active'])
+        self.assertEqual(before, cached)
+        self.assertEqual(1, fresh['active'])
+
     def test_history_api_requires_ui_header_and_matching_browser_session(self):
         headers = {
             'Host': 'localhost',
@@ -1,5 +1,9 @@
 import os
+import shutil
+import sqlite3
 import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
@@ -57,18 +61,37 @@ class FailingArcGIS:
 
 
 class GeocodingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # clear_geocode_caches() and every geocode_address() call touch the
+        # persisted geocode_cache table, so give the class its own database
+        # rather than whatever DB_PATH the first importer of app resolved.
+        cls.original_db_path = app.DB_PATH
+        cls.db_dir = tempfile.mkdtemp(prefix="caddo911-geocoding-")
+        app.DB_PATH = os.path.join(cls.db_dir, "caddo911.db")
+        app.init_db()
+
+    @classmethod
+    def tearDownClass(cls):
+        app.DB_PATH = cls.original_db_path
+        shutil.rmtree(cls.db_dir, ignore_errors=True)
+
     def setUp(self):
         self.original_arcgis = app.geolocator_arcgis
         self.original_osm = app.geolocator_osm
-        app.geocode_cache.clear()
-        app.geocode_intersection_cache.clear()
+        self.original_osm_interval = app.OSM_MIN_REQUEST_INTERVAL_SECONDS
+        app.OSM_MIN_REQUEST_INTERVAL_SECONDS = 0.0
+        self.original_arcgis_interval = app.ARCGIS_MIN_REQUEST_INTERVAL_SECONDS
+        app.ARCGIS_MIN_REQUEST_INTERVAL_SECONDS = 0.0
+        app.clear_geocode_caches()
         app.geolocator_osm = FakeOSM()
 
     def tearDown(self):
         app.geolocator_arcgis = self.original_arcgis
         app.geolocator_osm = self.original_osm
-        app.geocode_cache.clear()
-        app.geocode_intersection_cache.clear()
+        app.OSM_MIN_REQUEST_INTERVAL_SECONDS = self.original_osm_interval
+        app.ARCGIS_MIN_REQUEST_INTERVAL_SECONDS = self.original_arcgis_interval
+        app.clear_geocode_caches()
 
     def test_two_cross_streets_use_named_street_segment_midpoint(self):
         jump_query = (
@@ -154,6 +177,67 @@ class GeocodingTests(unittest.TestCase):
         self.assertFalse(result["provider_responded"])
         self.assertEqual({}, app.geocode_cache)
 
+    def test_persisted_confirmed_miss_is_reused_until_its_ttl_expires(self):
+        fake = FakeArcGIS({})
+        app.geolocator_arcgis = fake
+
+        first = app.geocode_address("NOWHERE RD", "", "SHV", source="caddo")
+        calls_after_first = len(fake.calls)
+        with patch.object(app, "GEOCODE_NEGATIVE_CACHE_TTL_SECONDS", 0):
+            # The in-memory miss never expires; only the persisted row does.
+            second = app.geocode_address("NOWHERE RD", "", "SHV", source="caddo")
+            self.assertEqual(calls_after_first, len(fake.calls))
+            app.geocode_cache.clear()
+            app.geocode_address("NOWHERE RD", "", "SHV", source="caddo")
+            self.assertGreater(len(fake.calls), calls_after_first)
+
+        calls_after_retry = len(fake.calls)
+        app.geocode_cache.clear()
+        third = app.geocode_address("NOWHERE RD", "", "SHV", source="caddo")
+
+        self.assertEqual("unresolved", first["quality"])
+        self.assertIs(first, second)
+        self.assertEqual("unresolved", third["quality"])
+        self.assertEqual(calls_after_retry, len(fake.calls))
+
+    def test_geocode_cache_evicts_least_recently_used_entry(self):
+        with patch.object(app, "GEOCODE_CACHE_MAX_ENTRIES", 2):
+            app._bounded_cache_put(app.geocode_cache, "a", {"lat": 1})
+            app._bounded_cache_put(app.geocode_cache, "b", {"lat": 2})
+            self.assertEqual({"lat": 1}, app._bounded_cache_get(app.geocode_cache, "a"))
+            app._bounded_cache_put(app.geocode_cache, "c", {"lat": 3})
+
+        self.assertEqual(["a", "c"], list(app.geocode_cache))
+
+    def test_resolved_geocode_survives_in_memory_cache_loss(self):
+        query = "MAYFAIR & HEATHERWOOD DR, Shreveport, Caddo Parish, LA"
+        app.geolocator_arcgis = FakeArcGIS({
+            query: [FakeLocation(
+                "Mayfair Dr & Heatherwood Dr, Shreveport, Louisiana, 71118",
+                32.4105,
+                -93.7911,
+                address_type="StreetInt",
+            )],
+        })
+
+        original_db_path = app.DB_PATH
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                app.DB_PATH = os.path.join(tmp_dir, "caddo911.db")
+                app.init_db()
+                first = app.geocode_address("MAYFAIR", "HEATHERWOOD DR", "SHV")
+
+                app.geocode_cache.clear()
+                app.geocode_intersection_cache.clear()
+                app.geolocator_arcgis = FailingArcGIS()
+                second = app.geocode_address("MAYFAIR", "HEATHERWOOD DR", "SHV")
+        finally:
+            app.DB_PATH = original_db_path
+
+        self.assertIsNotNone(first["lat"])
+        self.assertEqual(first["lat"], second["lat"])
+        self.assertEqual(first["quality"], second["quality"])
+
     def test_cross_pair_is_used_when_street_field_is_a_place_label(self):
         cross_query = (
             "CEDARWOOD LN & EASTWOOD DR, Shreveport, Caddo Parish, LA"
@@ -277,7 +361,8 @@ class GeocodingTests(unittest.TestCase):
         self.assertEqual("approximate-address-range", result["quality"])
         self.assertAlmostEqual(30.5526692499595, result["lat"], places=8)
         self.assertAlmostEqual(-91.1227483763, result["lng"], places=8)
-        self.assertEqual([start_query, end_query], [call[0] for call in fake.calls])
+        # Both endpoints are looked up concurrently, so only the set is fixed.
+        self.assertCountEqual([start_query, end_query], [call[0] for call in fake.calls])
 
     def test_baton_rouge_route_reference_and_corridor_label_are_normalized(self):
         sherwood_query = (
@@ -331,7 +416,7 @@ class GeocodingTests(unittest.TestCase):
         self.assertEqual("street-segment", result["quality"])
         self.assertAlmostEqual(30.424045748275, result["lat"], places=8)
         self.assertAlmostEqual(-91.073066667222, result["lng"], places=8)
-        self.assertEqual(
+        self.assertCountEqual(
             [sherwood_query, drusilla_query],
             [call[0] for call in fake.calls],
         )
@@ -574,6 +659,169 @@ class GeocodingTests(unittest.TestCase):
         finally:
             app.DB_PATH = original_db_path
 
+    def test_new_incidents_are_geocoded_before_insert(self):
+        incidents = [
+            {
+                "source": "caddo",
+                "agency": "SPD",
+                "time": "0800",
+                "units": 1,
+                "description": "ALARM",
+                "street": f"{number} MAYFAIR",
+                "cross_streets": "",
+                "municipality": "SHV",
+            }
+            for number in ("100", "200")
+        ]
+        geo = {
+            "lat": 32.41,
+            "lng": -93.79,
+            "source": "arcgis",
+            "quality": "address",
+            "query": "Mayfair",
+            "provider_responded": True,
+        }
+
+        # Both lookups must be in flight at once, on worker threads, while the
+        # collector's connection has not yet opened its write transaction.
+        both_in_flight = threading.Barrier(2, timeout=5)
+        connections = []
+        lookup_threads = []
+        in_transaction = []
+        real_db_connect = app.db_connect
+
+        def recording_db_connect(*args, **kwargs):
+            conn = real_db_connect(*args, **kwargs)
+            connections.append(conn)
+            return conn
+
+        def concurrent_geocode(*args, **kwargs):
+            lookup_threads.append(threading.get_ident())
+            in_transaction.append(connections[0].in_transaction)
+            both_in_flight.wait()
+            return dict(geo)
+
+        original_db_path = app.DB_PATH
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                app.DB_PATH = os.path.join(tmp_dir, "caddo911.db")
+                app.init_db()
+                with patch.object(app, "db_connect", side_effect=recording_db_connect), \
+                        patch.object(app, "geocode_address", side_effect=concurrent_geocode):
+                    app.process_incidents([dict(i) for i in incidents], source="caddo")
+                self.assertEqual(2, len(set(lookup_threads)))
+                self.assertNotIn(threading.get_ident(), lookup_threads)
+                self.assertEqual([False, False], in_transaction)
+
+                conn = app.db_connect(row_factory=True)
+                rows = conn.execute(
+                    "SELECT latitude, geocode_quality FROM incidents ORDER BY street"
+                ).fetchall()
+                conn.close()
+                self.assertEqual(2, len(rows))
+                for row in rows:
+                    self.assertAlmostEqual(32.41, row["latitude"])
+                    self.assertEqual("address", row["geocode_quality"])
+        finally:
+            app.DB_PATH = original_db_path
+
+    def test_geocoding_runs_before_the_write_lock_is_taken(self):
+        incident = {
+            "source": "caddo",
+            "agency": "SPD",
+            "time": "0900",
+            "units": 1,
+            "description": "ALARM",
+            "street": "300 MAYFAIR",
+            "cross_streets": "",
+            "municipality": "SHV",
+        }
+        lock_was_free = []
+
+        def geocode_while_probing_lock(*args, **kwargs):
+            probe = sqlite3.connect(app.DB_PATH, timeout=0)
+            try:
+                probe.execute("BEGIN IMMEDIATE")
+                probe.rollback()
+                lock_was_free.append(True)
+            except sqlite3.OperationalError:
+                lock_was_free.append(False)
+            finally:
+                probe.close()
+            return {
+                "lat": 32.41,
+                "lng": -93.79,
+                "source": "arcgis",
+                "quality": "address",
+                "query": "300 Mayfair",
+                "provider_responded": True,
+            }
+
+        original_db_path = app.DB_PATH
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                app.DB_PATH = os.path.join(tmp_dir, "caddo911.db")
+                app.init_db()
+                with patch.object(app, "geocode_address", side_effect=geocode_while_probing_lock):
+                    app.process_incidents([dict(incident)], source="caddo")
+        finally:
+            app.DB_PATH = original_db_path
+
+        self.assertEqual([True], lock_was_free)
+
+    def test_row_removed_before_the_write_lock_is_reinserted_as_new(self):
+        incident = {
+            "source": "caddo",
+            "agency": "SPD",
+            "time": "1000",
+            "units": 1,
+            "description": "ALARM",
+            "street": "400 MAYFAIR",
+            "cross_streets": "",
+            "municipality": "SHV",
+        }
+        geo = {
+            "lat": 32.41,
+            "lng": -93.79,
+            "source": "arcgis",
+            "quality": "address",
+            "query": "400 Mayfair",
+            "provider_responded": True,
+        }
+        resolve = app._resolve_incident_geocodes
+
+        def resolve_then_archive(pending, **kwargs):
+            # Stand in for the archiver deleting the row between the
+            # pre-lock load and BEGIN IMMEDIATE.
+            conn = app.db_connect()
+            conn.execute("DELETE FROM incidents")
+            conn.commit()
+            conn.close()
+            return resolve(pending, **kwargs)
+
+        original_db_path = app.DB_PATH
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                app.DB_PATH = os.path.join(tmp_dir, "caddo911.db")
+                app.init_db()
+                with patch.object(app, "geocode_address", return_value=dict(geo)):
+                    app.process_incidents([dict(incident)], source="caddo")
+                    with patch.object(app, "_resolve_incident_geocodes", side_effect=resolve_then_archive):
+                        app.process_incidents([dict(incident)], source="caddo")
+
+                conn = app.db_connect(row_factory=True)
+                rows = conn.execute(
+                    "SELECT first_seen, latitude, geocode_quality FROM incidents"
+                ).fetchall()
+                conn.close()
+        finally:
+            app.DB_PATH = original_db_path
+
+        self.assertEqual(1, len(rows))
+        self.assertIsNotNone(rows[0]["first_seen"])
+        self.assertAlmostEqual(32.41, rows[0]["latitude"])
+        self.assertEqual("address", rows[0]["geocode_quality"])
+
     def test_baton_rouge_published_point_replaces_same_version_fallback(self):
         incident = {
             "source": "batonrouge",
@@ -802,6 +1050,24 @@ class GeocodingTests(unittest.TestCase):
         finally:
             app.DB_PATH = original_db_path
 
+    def test_arcgis_request_starts_are_spaced_by_min_interval(self):
+        started = []
+
+        class RecordingArcGIS:
+            def geocode(self, query, **kwargs):
+                started.append(time.monotonic())
+                return None
+
+        app.geolocator_arcgis = RecordingArcGIS()
+        app.ARCGIS_MIN_REQUEST_INTERVAL_SECONDS = 0.05
+        for _ in range(3):
+            app._arcgis_geocode("100 MAIN ST, Shreveport, LA")
+
+        gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+        self.assertEqual(2, len(gaps))
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 0.045)
+
 
 if __name__ == "__main__":
     unittest.main()
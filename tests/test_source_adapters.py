@@ -1,6 +1,9 @@
 import unittest
 
-from sources import batonrouge, lafayette, neworleans
+import lxml.html
+import requests
+
+from sources import _html, batonrouge, caddo, lafayette, neworleans
 
 
 class SourceAdapterTests(unittest.TestCase):
@@ -13,6 +16,14 @@ class SourceAdapterTests(unittest.TestCase):
         self.assertEqual("CURRAN PKWY", cross_streets)
         self.assertEqual("LAFAYETTE", municipality)
 
+    def test_feed_clock_strings_become_hhmm(self):
+        self.assertEqual("0805", batonrouge._parse_time_to_hhmm("8:05:12 AM"))
+        self.assertEqual("0001", batonrouge._parse_time_to_hhmm("12:01 AM"))
+        self.assertEqual("2359", batonrouge._parse_time_to_hhmm("11:59 PM"))
+        self.assertEqual("1405", lafayette._parse_reported_time("10/15/2026 14:05"))
+        self.assertEqual("0007", lafayette._parse_reported_time("10/15/2026 0:07"))
+        self.assertEqual("", lafayette._parse_reported_time("10/15/2026 24:00"))
+
     def test_baton_rouge_intersection_location_is_split_once(self):
         street, cross_streets = batonrouge._split_location(
             "HOOPER RD / SULLIVAN RD",
@@ -31,6 +42,41 @@ class SourceAdapterTests(unittest.TestCase):
         self.assertEqual("14200 S HARRELL'S FERRY RD", street)
         self.assertEqual("WOODBROOK DR / MILLERVILLE RD", cross_streets)
 
+    def test_baton_rouge_reads_refreshed_text_across_markup(self):
+        doc = lxml.html.fromstring(
+            "<html><body><p>Last Updated <b>10/15/2026 8:05:12 AM</b></p>"
+            "<p>Number of incidents: 2</p></body></html>"
+        )
+
+        self.assertEqual(
+            "10/15/2026 8:05:12 AM",
+            batonrouge._extract_refreshed_at_text(doc),
+        )
+
+    def test_baton_rouge_cell_text_skips_script_and_comments(self):
+        cell = lxml.html.fragment_fromstring(
+            "<td>HOOPER<!-- note --><script>var y=1</script> <b>RD</b></td>"
+        )
+
+        self.assertEqual("HOOPER RD", batonrouge._node_text(cell))
+
+    def test_html_pages_decode_with_the_response_charset(self):
+        response = requests.Response()
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        response.encoding = "utf-8"
+        response._content = "<table><tr><td>CAF\u00c9 \u2013 ST</td></tr></table>".encode("utf-8")
+
+        doc = _html.parse_response(response)
+
+        self.assertEqual("CAF\u00c9 \u2013 ST", caddo._cell_text(next(doc.iter("td"))))
+
+    def test_caddo_cell_text_skips_script_and_comments(self):
+        cell = lxml.html.fragment_fromstring(
+            "<td>HOOPER<!-- note --><script>var y=1</script><b>RD</b></td>"
+        )
+
+        self.assertEqual("HOOPERRD", caddo._cell_text(cell))
+
     def test_baton_rouge_merges_the_official_traffic_map_point(self):
         incidents = [
             {